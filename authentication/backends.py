@@ -0,0 +1,45 @@
+from django.contrib.auth.backends import ModelBackend
+
+from core.models.user import User
+
+
+class EmailBackend(ModelBackend):
+    """ModelBackend that loads only the columns login actually needs.
+
+    The default backend pulls every user column — bio, avatar_url and
+    friends — just to verify a password. authenticate() narrows the
+    SELECT to the credential fields; get_user() keeps the full row minus
+    the large text columns, since request.user is rendered everywhere.
+    """
+
+    _LOGIN_ONLY_FIELDS = ("id", "password", "is_active", "status", "last_login")
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        # filter().first() instead of get(): email uniqueness is
+        # case-sensitive at the schema level, so case-variant duplicates
+        # can exist and get(email__iexact=...) would 500 on them. The
+        # exact-case match wins when both forms are registered.
+        candidates = User.objects.only(*self._LOGIN_ONLY_FIELDS)
+        user = (
+            candidates.filter(email=username).first()
+            or candidates.filter(email__iexact=username).first()
+        )
+        if user is None:
+            # Run the default hasher anyway so response timing doesn't
+            # leak whether the account exists (mirrors ModelBackend).
+            User().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user(self, user_id):
+        try:
+            user = User.objects.defer("bio", "avatar_url").get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -1,8 +1,11 @@
+from functools import cache
+
 from django.shortcuts import render
 from django.http import HttpRequest
 from django.views.generic.edit import FormView
 from django.urls import reverse
 from django.contrib.auth import authenticate, login
+from django.utils.http import url_has_allowed_host_and_scheme
 
 from .forms import LoginForm
 
@@ -33,12 +36,23 @@ class LoginView(FormView):
             form.add_error("", "Login failed. Invalid credentials.")
             return render(self.request, self.template_name, {"form": form})
 
-    def prepare_login_success_url(self) -> str:
-        redirect_url = self.request.GET["redirect-url"]
-        if not redirect_url or not redirect_url.strip():
-            redirect_url = reverse("app_home")
+    @staticmethod
+    @cache
+    def app_home_url() -> str:
+        # reverse() walks the URLconf; the result never changes, so
+        # resolve it once per process instead of once per login.
+        return reverse("app_home")
 
-        return redirect_url
+    def prepare_login_success_url(self) -> str:
+        redirect_url = self.request.GET.get("redirect-url", "").strip()
+        if redirect_url and url_has_allowed_host_and_scheme(
+            redirect_url,
+            allowed_hosts={self.request.get_host()},
+            require_https=self.request.is_secure(),
+        ):
+            return redirect_url
+
+        return self.app_home_url()
 
     def handle_remember_me(self, remember_me):
         if not remember_me:
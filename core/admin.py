@@ -1,5 +1,9 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models.functions import Substr
+from django.utils.functional import cached_property
 from core.models import (
     User,
     Channel,
@@ -9,9 +13,45 @@ from core.models import (
     UserSubscription,
     Flag,
     ModerationLog,
+    SearchQuery,
+    UserWatchHistory,
+    ChannelAnalytics,
+    VideoAnalytics,
+    TrendingVideo,
 )
 
 
+class EstimateCountPaginator(Paginator):
+    """Paginator that answers COUNT(*) from the PostgreSQL planner stats.
+
+    The admin changelist counts the full table on every page load, which is
+    O(rows) on the append-only analytics tables. For unfiltered changelists
+    on PostgreSQL this reads pg_class.reltuples instead (a single catalog
+    lookup); filtered querysets, other backends, and never-analyzed tables
+    fall back to the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        if connection.vendor == "postgresql" and not self.object_list.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row is not None and row[0] >= 0:
+                return row[0]
+        return super().count
+
+
+class ModelAdminEstimateCountMixin:
+    """Use estimated row counts on changelists for very large tables"""
+
+    paginator = EstimateCountPaginator
+    show_full_result_count = False
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     list_display = ["username", "email", "role", "status", "created_at"]
@@ -48,6 +88,7 @@ class ChannelAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["status", "verified", "monetization_enabled"]
+    list_select_related = ("user",)
     search_fields = ["name", "handle", "user__username"]
     ordering = ["-subscriber_count"]
     readonly_fields = [
@@ -70,6 +111,7 @@ class VideoAdmin(admin.ModelAdmin):
         "published_at",
     ]
     list_filter = ["status", "visibility", "age_restricted"]
+    raw_id_fields = ("channel", "active_version")
     search_fields = ["title", "channel__name"]
     ordering = ["-published_at"]
     readonly_fields = [
@@ -81,6 +123,9 @@ class VideoAdmin(admin.ModelAdmin):
         "updated_at",
     ]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("channel", "channel__user")
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
@@ -93,11 +138,33 @@ class CommentAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["status"]
+    raw_id_fields = ("user", "video", "parent")
     search_fields = ["text", "user__username", "video__title"]
     ordering = ["-created_at"]
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user", "video", "video__channel")
+            .only(
+                "id",
+                "user_id",
+                "video_id",
+                "status",
+                "like_count",
+                "created_at",
+                "user__username",
+                "user__email",
+                "video__title",
+                "video__channel__name",
+            )
+            .annotate(text_head=Substr("text", 1, 51))
+        )
+
     def text_preview(self, obj):
-        return obj.text[:50] + "..." if len(obj.text) > 50 else obj.text
+        preview = obj.text_head
+        return preview[:50] + "…" if len(preview) > 50 else preview
 
     text_preview.short_description = "Comment"
 
@@ -117,6 +184,8 @@ class SubscriptionPlanAdmin(admin.ModelAdmin):
 class UserSubscriptionAdmin(admin.ModelAdmin):
     list_display = ["user", "plan", "status", "start_date", "renewal_date"]
     list_filter = ["status", "plan"]
+    list_select_related = ("user", "plan")
+    raw_id_fields = ("user",)
     search_fields = ["user__username", "user__email"]
     ordering = ["-created_at"]
 
@@ -124,21 +193,91 @@ class UserSubscriptionAdmin(admin.ModelAdmin):
 @admin.register(Flag)
 class FlagAdmin(admin.ModelAdmin):
     list_display = [
-        "content_type",
-        "object_id",
+        "target",
         "reason",
         "status",
         "user",
         "created_at",
     ]
     list_filter = ["status", "reason"]
+    list_select_related = (
+        "user",
+        "video",
+        "video__channel",
+        "comment",
+        "target_user",
+    )
+    raw_id_fields = ("video", "comment", "target_user", "user", "reviewed_by")
     search_fields = ["user__username", "reason_detail"]
     ordering = ["-created_at"]
 
 
 @admin.register(ModerationLog)
 class ModerationLogAdmin(admin.ModelAdmin):
-    list_display = ["moderator", "action", "content_type", "object_id", "created_at"]
+    list_display = ["moderator", "action", "target", "created_at"]
     list_filter = ["action"]
+    list_select_related = (
+        "moderator",
+        "video",
+        "video__channel",
+        "comment",
+        "target_user",
+    )
+    raw_id_fields = ("video", "comment", "target_user", "moderator", "related_flag")
     search_fields = ["moderator__username", "reason"]
     ordering = ["-created_at"]
+
+
+@admin.register(SearchQuery)
+class SearchQueryAdmin(ModelAdminEstimateCountMixin, admin.ModelAdmin):
+    list_display = ["query", "user", "result_count", "click_position", "created_at"]
+    list_select_related = ("user",)
+    raw_id_fields = ("user", "clicked_video")
+    search_fields = ["normalized_query", "user__username"]
+    ordering = ["-created_at"]
+
+
+@admin.register(UserWatchHistory)
+class UserWatchHistoryAdmin(ModelAdminEstimateCountMixin, admin.ModelAdmin):
+    list_display = ["user", "video", "watch_percentage", "completed", "watched_at"]
+    list_filter = ["completed"]
+    list_select_related = ("user", "video", "video__channel")
+    raw_id_fields = ("user", "video")
+    search_fields = ["user__username", "video__title"]
+    ordering = ["-watched_at"]
+
+
+@admin.register(ChannelAnalytics)
+class ChannelAnalyticsAdmin(ModelAdminEstimateCountMixin, admin.ModelAdmin):
+    list_display = ["channel", "date", "total_views", "net_subscriber_change"]
+    list_select_related = ("channel",)
+    raw_id_fields = ("channel",)
+    search_fields = ["channel__name"]
+    ordering = ["-date"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer("traffic_source_data")
+
+
+@admin.register(VideoAnalytics)
+class VideoAnalyticsAdmin(ModelAdminEstimateCountMixin, admin.ModelAdmin):
+    list_display = ["video", "date", "views", "watch_time_seconds"]
+    list_select_related = ("video", "video__channel")
+    raw_id_fields = ("video",)
+    search_fields = ["video__title"]
+    ordering = ["-date"]
+
+    def get_queryset(self, request):
+        return (
+            super().get_queryset(request).defer("demographics_data", "retention_curve")
+        )
+
+
+@admin.register(TrendingVideo)
+class TrendingVideoAdmin(ModelAdminEstimateCountMixin, admin.ModelAdmin):
+    list_display = ["rank", "video", "score", "category", "region", "date"]
+    list_filter = ["region"]
+    list_select_related = ("video", "video__channel")
+    raw_id_fields = ("video",)
+    search_fields = ["video__title"]
+    ordering = ["date", "rank"]
@@ -1,5 +1,13 @@
-from django.db import models
+import threading
+
+from django.core.cache import cache
+from django.db import connection, models
+from django.db.models.functions import Coalesce, Now
 from django.utils import timezone
+from django_fast_count.managers import FastCountManager
+
+from core.middleware import cached_per_request
+from core.models.choices import CommentStatus, InteractionType, SubscriptionStatus
 
 
 class PublishedVideoManager(models.Manager):
@@ -12,7 +20,7 @@ class PublishedVideoManager(models.Manager):
             .filter(
                 status="PUBLISHED",
                 visibility="PUBLIC",
-                published_at__lte=timezone.now(),
+                published_at__lte=Now(),
             )
         )
 
@@ -24,8 +32,691 @@ class ActiveChannelManager(models.Manager):
         return super().get_queryset().filter(status="ACTIVE", deleted_at__isnull=True)
 
 
+class ChannelQuerySet(models.QuerySet):
+    """QuerySet helpers for channels"""
+
+    def with_quotas(self):
+        """Annotate the subscriber-count derived quota tiers for SQL filtering"""
+        premium = models.Q(subscriber_count__gte=1000)
+        return self.annotate(
+            quota_videos_per_week=models.Case(
+                models.When(premium, then=999999), default=10
+            ),
+            quota_video_duration_minutes=models.Case(
+                models.When(premium, then=720), default=15
+            ),
+            quota_file_size_gb=models.Case(models.When(premium, then=50), default=2),
+        )
+
+
+class VideoQuerySet(models.QuerySet):
+    """QuerySet helpers for videos"""
+
+    def with_display(self):
+        """Join the relations __str__ and list rendering touch"""
+        return self.select_related("channel", "active_version")
+
+    def card_fields(self):
+        """Narrow to the homepage/card projection.
+
+        Keeps the 10KB description and geo JSON out of list fetches and
+        lines up with the covering feed index for index-only scans.
+        """
+        return self.only(
+            "id", "title", "thumbnail_url", "view_count", "published_at", "channel_id"
+        )
+
+    def blocked_in(self, country_code):
+        """Videos geo-blocked for a country.
+
+        On PostgreSQL this is a JSONB containment probe served by the
+        GIN jsonb_path_ops index from migration 0029. Other backends
+        fall back to a substring match over the serialized list.
+        """
+        if connection.vendor == "postgresql":
+            return self.filter(geo_restrictions__contains=[country_code])
+        return self.filter(geo_restrictions__icontains=f'"{country_code}"')
+
+    def for_playback(self):
+        """The active version and its ABR ladder in two queries.
+
+        Manifest rendering otherwise loads the video, then the active
+        version, then its assets — three round-trips per playback start.
+        """
+        from core.models.video import VideoAsset
+
+        return self.select_related("active_version").prefetch_related(
+            models.Prefetch(
+                "active_version__assets",
+                queryset=VideoAsset.objects.order_by("-bitrate_kbps").only(
+                    "id",
+                    "video_version_id",
+                    "resolution",
+                    "bitrate_kbps",
+                    "playlist_url",
+                    "codec",
+                ),
+            )
+        )
+
+    def with_tags(self):
+        """Prefetch tags through the relation table in two fixed queries.
+
+        Naive video.tag_relations iteration costs a query per relation
+        plus one per tag; the Prefetch joins the tag inline and trims
+        the row to the columns tag chips render.
+        """
+        from core.models.video import VideoTagRelation
+
+        return self.prefetch_related(
+            models.Prefetch(
+                "tag_relations",
+                queryset=VideoTagRelation.objects.select_related("tag").only(
+                    "id", "video_id", "tag_id", "tag__name", "tag__slug"
+                ),
+            )
+        )
+
+
+class VideoAssetQuerySet(models.QuerySet):
+    """QuerySet helpers for transcoded assets"""
+
+    def with_display(self):
+        return self.select_related("video_version__video__channel")
+
+
+class VideoTagManager(models.Manager):
+    """Manager for video tags"""
+
+    def refresh_usage_counts(self):
+        """Recompute usage_count from the relation table in one pass.
+
+        Per-insert counter bumps turn popular tags into write hotspots;
+        this periodic set-based recompute (the cross-database stand-in
+        for a materialized-view refresh) replaces them with one GROUP BY
+        plus a batched UPDATE of only the rows that changed. Returns the
+        number of tags updated.
+        """
+        from core.models.video import VideoTagRelation
+
+        counts = dict(
+            VideoTagRelation.objects.values_list("tag_id")
+            .annotate(c=models.Count("id"))
+            .values_list("tag_id", "c")
+        )
+        changed = []
+        for tag in self.only("id", "usage_count"):
+            new_count = counts.get(tag.pk, 0)
+            if tag.usage_count != new_count:
+                tag.usage_count = new_count
+                changed.append(tag)
+        if changed:
+            self.bulk_update(changed, ["usage_count"], batch_size=1000)
+        return len(changed)
+
+
+class SubtitleQuerySet(models.QuerySet):
+    """QuerySet helpers for subtitles"""
+
+    def with_display(self):
+        return self.select_related("video_version__video__channel")
+
+
+class UserSubscriptionQuerySet(models.QuerySet):
+    """QuerySet helpers for premium subscriptions"""
+
+    def with_active_flag(self):
+        """Annotate is_active_db so batch jobs evaluate activity in SQL
+        (one Case/When against NOW()) instead of a Python branch and
+        timezone.now() call per row."""
+        return self.annotate(
+            is_active_db=models.Case(
+                models.When(status=SubscriptionStatus.ACTIVE, then=True),
+                models.When(
+                    status=SubscriptionStatus.GRACE_PERIOD,
+                    grace_period_ends_at__gt=Now(),
+                    then=True,
+                ),
+                default=False,
+                output_field=models.BooleanField(),
+            )
+        )
+
+
+class PaymentTransactionQuerySet(models.QuerySet):
+    """QuerySet helpers for payment transactions"""
+
+    def with_display(self):
+        return self.select_related("user", "subscription__plan")
+
+    def for_listing(self):
+        """Transaction lists never render the failure text"""
+        return self.defer("failure_reason")
+
+    def in_period(self, start, end):
+        """Transactions in a created_at range — the shape monthly
+        partition pruning would serve; the BRIN range scan covers it
+        until the table moves to native partitions."""
+        return self.filter(created_at__gte=start, created_at__lt=end)
+
+
+class RevenueShareManager(models.Manager):
+    """Manager for per-video revenue attribution"""
+
+    def bulk_upsert(self, entries, batch_size=1000):
+        """Ingest revenue rows in multi-row INSERT ... ON CONFLICT
+        batches keyed on (video, date); creator_revenue_cents is a
+        generated column and never written by the client."""
+        return self.bulk_create(
+            entries,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=[
+                "ad_impressions",
+                "ad_revenue_cents",
+                "premium_views",
+                "premium_revenue_cents",
+                "total_revenue_cents",
+                "creator_share_percentage",
+            ],
+            unique_fields=["video", "date"],
+        )
+
+
+class CreatorPayoutManager(models.Manager):
+    """Manager for creator payouts"""
+
+    def generate_for_period(self, period_start, period_end):
+        """Build one payout row per channel for a period from RevenueShare.
+
+        A single GROUP BY aggregate replaces per-channel Python summing
+        loops, and the results land in one upsert batch keyed on
+        (channel, period_start, period_end) — re-running a period
+        refreshes the numbers instead of duplicating rows. Gateway fees
+        and tax withholding are filled in later by the payment
+        processor.
+        """
+        from core.models.payment import RevenueShare
+
+        rows = (
+            RevenueShare.objects.filter(date__range=(period_start, period_end))
+            .values("channel_id")
+            .annotate(
+                ad=models.Sum("ad_revenue_cents"),
+                premium=models.Sum("premium_revenue_cents"),
+                total=models.Sum("total_revenue_cents"),
+                creator=models.Sum("creator_revenue_cents"),
+            )
+        )
+        payouts = [
+            self.model(
+                channel_id=row["channel_id"],
+                period_start=period_start,
+                period_end=period_end,
+                ad_revenue_cents=row["ad"],
+                premium_revenue_cents=row["premium"],
+                total_revenue_cents=row["total"],
+                platform_fee_cents=row["total"] - row["creator"],
+                net_payout_cents=row["creator"],
+            )
+            for row in rows.iterator()
+        ]
+        return self.bulk_create(
+            payouts,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["channel", "period_start", "period_end"],
+            update_fields=[
+                "ad_revenue_cents",
+                "premium_revenue_cents",
+                "total_revenue_cents",
+                "platform_fee_cents",
+                "net_payout_cents",
+            ],
+        )
+
+
 class UnreadNotificationManager(models.Manager):
     """Manager for unread notifications"""
 
     def get_queryset(self):
         return super().get_queryset().filter(read=False)
+
+
+class SubscriptionPlanManager(models.Manager):
+    """Manager for subscription plans"""
+
+    # In-process plan cache: the table changes rarely but is read on
+    # every checkout and permission decision. post_save/post_delete on
+    # SubscriptionPlan clear it; multi-process deployments converge as
+    # each worker repopulates on its next lookup.
+    _plan_cache = {}
+    _plan_cache_lock = threading.Lock()
+
+    @cached_per_request
+    def active_plans(self):
+        """Active plans, resolved at most once per request"""
+        return list(self.filter(is_active=True))
+
+    def get_cached(self, plan_type):
+        """Plan by type, served from the in-process cache"""
+        try:
+            return self._plan_cache[plan_type]
+        except KeyError:
+            plan = self.get(plan_type=plan_type)
+            with self._plan_cache_lock:
+                self._plan_cache[plan_type] = plan
+            return plan
+
+    @classmethod
+    def invalidate_cache(cls, *args, **kwargs):
+        """Signal receiver: drop every cached plan on any write"""
+        with cls._plan_cache_lock:
+            cls._plan_cache.clear()
+
+
+class PopularSearchManager(models.Manager):
+    """Manager for aggregated popular searches"""
+
+    def record_search(self, query):
+        """Count one search atomically and bucket it by day.
+
+        The query is normalized (lowercase, trimmed — mirroring
+        SearchQuery.normalized_query) so "Cats" and "cats" share one
+        row and the case-sensitive prefix scan in autocomplete() finds
+        what was recorded. The lifetime counter gets a single F()
+        UPDATE; the day's SearchCountBucket row is upserted the same
+        way, so daily/weekly/monthly popularity is a SUM over buckets
+        instead of three columns with three reset cadences.
+        """
+        from core.models.analytics import SearchCountBucket
+
+        query = query.lower().strip()
+        if not query:
+            return
+
+        counters = dict(
+            search_count=models.F("search_count") + 1,
+            last_searched_at=Now(),
+        )
+        pk = self.filter(query=query).values_list("pk", flat=True).first()
+        if pk is None:
+            row, created = self.get_or_create(
+                query=query, defaults=dict(search_count=1)
+            )
+            pk = row.pk
+            if not created:
+                self.filter(pk=pk).update(**counters)
+        else:
+            self.filter(pk=pk).update(**counters)
+
+        today = timezone.localdate()
+        bump = dict(count=models.F("count") + 1)
+        buckets = SearchCountBucket.objects.filter(popular_search_id=pk, bucket=today)
+        if not buckets.update(**bump):
+            _, created = SearchCountBucket.objects.get_or_create(
+                popular_search_id=pk, bucket=today, defaults=dict(count=1)
+            )
+            if not created:
+                buckets.update(**bump)
+
+    def with_window_counts(self, today=None):
+        """Annotate daily/weekly/monthly counts from the day buckets"""
+        today = today or timezone.localdate()
+
+        def window(days):
+            return Coalesce(
+                models.Sum(
+                    "buckets__count",
+                    filter=models.Q(
+                        buckets__bucket__gt=today - timezone.timedelta(days=days)
+                    ),
+                ),
+                0,
+            )
+
+        return self.annotate(
+            daily_count=window(1),
+            weekly_count=window(7),
+            monthly_count=window(30),
+        )
+
+    def autocomplete(self, prefix, limit=10):
+        """Top queries matching a prefix, most searched first.
+
+        startswith compiles to LIKE 'prefix%', served on PostgreSQL by
+        the varchar_pattern_ops index from migration 0030 (a collated
+        b-tree cannot range-scan LIKE patterns there); substring
+        matching would need a pg_trgm GIN index and stays out of this
+        path.
+        """
+        prefix = prefix.lower().strip()
+        if not prefix:
+            return []
+        return list(
+            self.filter(query__startswith=prefix)
+            .order_by("-search_count")
+            .values_list("query", flat=True)[:limit]
+        )
+
+
+class CommentManager(FastCountManager):
+    """Manager for threaded comments"""
+
+    def threads_for_video(self, video_id, limit=20):
+        """Top-N newest threads, each fully loaded, in two queries.
+
+        Roots come off the (video, status, -created_at) index; every
+        comment in those threads then arrives in one root_id range scan
+        and is grouped in Python — no per-parent reply queries and no
+        recursive self-joins.
+        """
+        root_ids = list(
+            self.filter(
+                video_id=video_id,
+                parent__isnull=True,
+                status=CommentStatus.ACTIVE,
+            )
+            .order_by("-created_at")
+            .values_list("pk", flat=True)[:limit]
+        )
+        threads = {pk: [] for pk in root_ids}
+        for comment in self.filter(
+            root_id__in=root_ids, status=CommentStatus.ACTIVE
+        ).order_by("root_id", "created_at"):
+            threads[comment.root_id].append(comment)
+        return [threads[pk] for pk in root_ids]
+
+
+class TimeSeriesManager(FastCountManager):
+    """Manager for unbounded append-only event tables.
+
+    .count() comes from django-fast-count (cached, refreshed in the
+    background) because these tables are the ones whose admin
+    changelists and dashboards would otherwise pay a full COUNT(*).
+
+    On a partitioned PostgreSQL deployment retention is DROP PARTITION;
+    this tree migrates cross-database, so retention runs as bounded-size
+    delete batches instead — short transactions, no long row locks, and
+    vacuumable chunks rather than one table-wide DELETE.
+    """
+
+    time_field = "timestamp"
+
+    def prune_older_than(self, cutoff, batch_size=10000):
+        """Delete events older than cutoff in pk batches; returns rows removed"""
+        total = 0
+        while True:
+            pks = list(
+                self.filter(**{f"{self.time_field}__lt": cutoff}).values_list(
+                    "pk", flat=True
+                )[:batch_size]
+            )
+            if not pks:
+                return total
+            total += self.filter(pk__in=pks).delete()[0]
+
+
+class InteractionManager(TimeSeriesManager):
+    """Manager for raw interaction events"""
+
+
+class WatchSessionManager(TimeSeriesManager):
+    """Manager for watch session events"""
+
+    time_field = "started_at"
+
+
+class SearchQueryManager(TimeSeriesManager):
+    """Manager for search query events"""
+
+    time_field = "created_at"
+
+
+class UserWatchHistoryManager(FastCountManager):
+    """Manager for the watch-history rollup"""
+
+    def bulk_upsert(self, entries, batch_size=1000):
+        """Write watch progress in multi-row INSERT ... ON CONFLICT
+        batches keyed on (user, video) instead of get_or_create per row."""
+        return self.bulk_create(
+            entries,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=[
+                "watch_percentage",
+                "watch_duration_seconds",
+                "completed",
+                "last_position_seconds",
+                "updated_at",
+            ],
+            unique_fields=["user", "video"],
+        )
+
+
+class VideoAnalyticsManager(models.Manager):
+    """Manager that keeps daily rollups current as events arrive"""
+
+    def bulk_upsert(self, entries, batch_size=1000):
+        """Push a day's aggregates in one INSERT ... ON CONFLICT batch
+        keyed on (video, date); counters are overwritten with the
+        aggregation job's totals."""
+        return self.bulk_create(
+            entries,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=[
+                "views",
+                "unique_viewers",
+                "watch_time_seconds",
+                "likes",
+                "dislikes",
+                "comments",
+                "shares",
+            ],
+            unique_fields=["video", "date"],
+        )
+
+    _INTERACTION_COUNTERS = {
+        InteractionType.VIEW: "views",
+        InteractionType.LIKE: "likes",
+        InteractionType.DISLIKE: "dislikes",
+        InteractionType.WATCH_TIME: "watch_time_seconds",
+    }
+
+    def record_interaction(self, interaction):
+        """Fold one Interaction into its (video, date) daily row.
+
+        SUM/COUNT aggregates only need the newly-arrived delta, so each
+        event is an atomic increment on the day's row — no nightly
+        rescan of the interactions table. First event of the day inserts
+        the row; a lost insert race falls back to the UPDATE path.
+        """
+        counter = self._INTERACTION_COUNTERS.get(interaction.type)
+        if counter is None:
+            return False
+        delta = (
+            interaction.value if interaction.type == InteractionType.WATCH_TIME else 1
+        )
+        day = (interaction.timestamp or timezone.now()).date()
+        deltas = {counter: models.F(counter) + delta}
+        updated = self.filter(video_id=interaction.video_id, date=day).update(**deltas)
+        if not updated:
+            _, created = self.get_or_create(
+                video_id=interaction.video_id, date=day, defaults={counter: delta}
+            )
+            if not created:
+                self.filter(video_id=interaction.video_id, date=day).update(**deltas)
+        return True
+
+
+class ChannelAnalyticsManager(models.Manager):
+    """Manager that keeps daily channel rollups current as events arrive"""
+
+    def bulk_upsert(self, entries, batch_size=1000):
+        """Push a day's aggregates in one INSERT ... ON CONFLICT batch
+        keyed on (channel, date)."""
+        return self.bulk_create(
+            entries,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=[
+                "total_views",
+                "unique_viewers",
+                "total_watch_time_seconds",
+                "average_view_duration_seconds",
+                "likes",
+                "dislikes",
+                "comments",
+                "shares",
+                "new_subscribers",
+                "unsubscribers",
+                "estimated_revenue_cents",
+            ],
+            unique_fields=["channel", "date"],
+        )
+
+    def record_subscription_change(self, channel_id, subscribed):
+        """Fold one (un)subscribe into the channel's daily row.
+
+        Same atomic upsert shape as VideoAnalyticsManager: one counter
+        increment per event, no nightly rescan. net_subscriber_change is
+        a generated column, so only the source counter is written.
+        """
+        counter = "new_subscribers" if subscribed else "unsubscribers"
+        day = timezone.localdate()
+        deltas = {counter: models.F(counter) + 1}
+        updated = self.filter(channel_id=channel_id, date=day).update(**deltas)
+        if not updated:
+            _, created = self.get_or_create(
+                channel_id=channel_id, date=day, defaults={counter: 1}
+            )
+            if not created:
+                self.filter(channel_id=channel_id, date=day).update(**deltas)
+
+
+class TrafficSourceBreakdownManager(models.Manager):
+    """Manager for per-source analytics rows"""
+
+    def bulk_upsert(self, entries, batch_size=1000):
+        """Write a day's per-source rows in batches, updating view counts
+        for (analytics, source) pairs that already exist."""
+        return self.bulk_create(
+            entries,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=["views"],
+            unique_fields=["analytics", "source"],
+        )
+
+
+class RecommendationCacheManager(models.Manager):
+    """Manager with batched upsert for recommendation jobs"""
+
+    _CACHE_KEY = "rec:{user_id}:{context}"
+
+    def bulk_upsert(self, entries, batch_size=1000):
+        """Insert or refresh caches with multi-row INSERT ... ON CONFLICT
+        DO UPDATE batches instead of one round-trip per user."""
+        created = self.bulk_create(
+            entries,
+            batch_size=batch_size,
+            update_conflicts=True,
+            update_fields=[
+                "video_ids",
+                "algorithm_version",
+                "score_threshold",
+                "expires_at",
+                "updated_at",
+            ],
+            unique_fields=["user", "context"],
+        )
+        cache.delete_many(
+            [
+                self._CACHE_KEY.format(user_id=entry.user_id, context=entry.context)
+                for entry in entries
+            ]
+        )
+        return created
+
+    def lookup(self, user_id, context="home"):
+        """Read-through video id list for a user/context.
+
+        Serves from the configured cache backend with a TTL matching the
+        row's expires_at, so the hot read path only touches the table on
+        a cache miss.
+        """
+        key = self._CACHE_KEY.format(user_id=user_id, context=context)
+        video_ids = cache.get(key)
+        if video_ids is not None:
+            return video_ids
+        row = (
+            self.filter(user_id=user_id, context=context, expires_at__gt=Now())
+            .values_list("video_ids", "expires_at")
+            .first()
+        )
+        if row is None:
+            return []
+        video_ids, expires_at = row
+        cache.set(key, video_ids, timeout=(expires_at - timezone.now()).total_seconds())
+        return video_ids
+
+    def purge_expired(self, batch_size=10000):
+        """Delete expired rows in bounded pk batches (see TimeSeriesManager
+        for why expiry avoids one table-wide DELETE); returns rows removed."""
+        total = 0
+        while True:
+            pks = list(
+                self.filter(expires_at__lt=Now()).values_list("pk", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not pks:
+                return total
+            total += self.filter(pk__in=pks).delete()[0]
+
+
+class TrendingVideoManager(models.Manager):
+    """Manager with batched insert for trending snapshot jobs"""
+
+    def bulk_insert(self, entries, batch_size=1000):
+        """Insert a trending snapshot in multi-row batches; rows already
+        present for (video, date, region) are left untouched."""
+        return self.bulk_create(entries, batch_size=batch_size, ignore_conflicts=True)
+
+    def refresh_snapshot(self, date, region="BD", limit=50):
+        """Rebuild the trending snapshot for (date, region) as one set.
+
+        The materialized-view equivalent of this rollup is PostgreSQL-
+        only, so the refresh stays in the ORM: one aggregate query over
+        the day's VideoAnalytics ranks videos by score, and the snapshot
+        is swapped atomically — no row-by-row cache writes.
+        """
+        from django.db import transaction
+
+        from core.models.analytics import VideoAnalytics
+
+        ranked = (
+            VideoAnalytics.objects.filter(date=date)
+            .annotate(
+                score=models.F("views")
+                + (models.F("likes") + models.F("comments") + models.F("shares")) * 10
+            )
+            .order_by("-score")
+            .values_list("video_id", "score")[:limit]
+        )
+        with transaction.atomic():
+            self.filter(date=date, region=region).delete()
+            return self.bulk_create(
+                [
+                    self.model(
+                        video_id=video_id,
+                        rank=rank,
+                        score=score,
+                        region=region,
+                        date=date,
+                    )
+                    for rank, (video_id, score) in enumerate(ranked, start=1)
+                ],
+                batch_size=1000,
+            )
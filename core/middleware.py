@@ -0,0 +1,40 @@
+import threading
+from functools import wraps
+
+_request_cache = threading.local()
+
+
+class RequestQueryCacheMiddleware:
+    """Per-request memoization store for @cached_per_request helpers.
+
+    Template includes and view code frequently re-run the same idempotent
+    lookup within one render (subscription plans, content types, ...).
+    Helpers decorated with cached_per_request resolve once per request
+    and reuse the result; outside a request cycle they just pass through.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        _request_cache.store = {}
+        try:
+            return self.get_response(request)
+        finally:
+            del _request_cache.store
+
+
+def cached_per_request(func):
+    """Memoize an idempotent helper for the duration of the request"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        store = getattr(_request_cache, "store", None)
+        if store is None:
+            return func(*args, **kwargs)
+        key = (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+        if key not in store:
+            store[key] = func(*args, **kwargs)
+        return store[key]
+
+    return wrapper
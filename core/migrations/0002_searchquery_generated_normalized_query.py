@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="searchquery",
+            name="search_quer_normali_18078d_idx",
+        ),
+        migrations.RemoveField(
+            model_name="searchquery",
+            name="normalized_query",
+        ),
+        migrations.AddField(
+            model_name="searchquery",
+            name="normalized_query",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Lower(
+                    django.db.models.functions.text.Trim("query")
+                ),
+                help_text="Lowercase, trimmed version for grouping",
+                output_field=models.CharField(max_length=255),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="searchquery",
+            index=models.Index(
+                fields=["normalized_query", "created_at"],
+                name="search_quer_normali_18078d_idx",
+            ),
+        ),
+    ]
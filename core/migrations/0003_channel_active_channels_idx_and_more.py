@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_searchquery_generated_normalized_query'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='channel',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('status', 'ACTIVE')), fields=['-subscriber_count'], name='active_channels_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(condition=models.Q(('status', 'PUBLISHED'), ('visibility', 'PUBLIC')), fields=['-published_at'], name='published_public_videos_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_channel_active_channels_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='trendingvideo',
+            name='trending_vi_date_b06670_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='videoanalytics',
+            name='video_analy_video_i_811368_idx',
+        ),
+        migrations.AddIndex(
+            model_name='trendingvideo',
+            index=models.Index(fields=['date', 'region', 'rank'], include=('score', 'video_id'), name='trending_cov_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videoanalytics',
+            index=models.Index(fields=['video', 'date'], include=('views', 'watch_time_seconds', 'estimated_revenue_cents'), name='video_analytics_cov_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:36
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_remove_trendingvideo_trending_vi_date_b06670_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='videoanalytics',
+            name='engagement_rate_scaled',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(then=0, views=0), default=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('likes'), '+', models.F('dislikes')), '+', models.F('comments')), '+', models.F('shares')), '*', models.Value(10000)), '/', models.F('views'))), output_field=models.IntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='videoanalytics',
+            index=models.Index(fields=['-engagement_rate_scaled'], name='video_analy_engagem_8515cf_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_videoanalytics_engagement_rate_scaled_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userwatchhistory',
+            index=models.Index(condition=models.Q(('watch_percentage__gte', 90.0)), fields=['user', 'completed'], name='watch_history_completed_idx'),
+        ),
+    ]
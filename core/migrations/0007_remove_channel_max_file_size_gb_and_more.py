@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_userwatchhistory_watch_history_completed_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='channel',
+            name='max_file_size_gb',
+        ),
+        migrations.RemoveField(
+            model_name='channel',
+            name='max_video_duration_minutes',
+        ),
+        migrations.RemoveField(
+            model_name='channel',
+            name='max_videos_per_week',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_remove_channel_max_file_size_gb_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='videoanalytics',
+            name='traffic_sources',
+        ),
+        migrations.CreateModel(
+            name='TrafficSourceBreakdown',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50)),
+                ('views', models.IntegerField(default=0)),
+                ('analytics', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='traffic_source_rows', to='core.videoanalytics')),
+            ],
+            options={
+                'db_table': 'video_analytics_traffic_sources',
+                'ordering': ['-views'],
+                'indexes': [models.Index(fields=['source'], name='video_analy_source_c8935c_idx')],
+                'unique_together': {('analytics', 'source')},
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:44
+
+from django.db import migrations, models
+
+# Append-only tables with monotonically increasing time columns; a BRIN
+# index is orders of magnitude smaller than a B-tree here and serves the
+# same "last N days" range scans without hot right-edge page splits.
+TIME_INDEXES = [
+    ("interactions", "timestamp", "interactions_ts_brin"),
+    ("watch_sessions", "started_at", "watch_sessions_started_brin"),
+    ("user_watch_history", "watched_at", "watch_history_watched_brin"),
+    ("search_queries", "created_at", "search_queries_created_brin"),
+]
+
+
+def create_time_indexes(apps, schema_editor):
+    for table, column, name in TIME_INDEXES:
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(
+                f'CREATE INDEX "{name}" ON "{table}" USING brin ("{column}") '
+                "WITH (pages_per_range = 32)"
+            )
+        else:
+            # Backends without BRIN keep a plain index for range scans.
+            schema_editor.execute(f'CREATE INDEX "{name}" ON "{table}" ("{column}")')
+
+
+def drop_time_indexes(apps, schema_editor):
+    for table, column, name in TIME_INDEXES:
+        schema_editor.execute(f'DROP INDEX "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_remove_videoanalytics_traffic_sources_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='interaction',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='searchquery',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='userwatchhistory',
+            name='watched_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.RunPython(create_time_indexes, drop_time_indexes),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_time_series_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='comments_video_i_68aa4f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='interaction',
+            name='interaction_video_i_241031_idx',
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['video', 'status', '-created_at'], include=('like_count', 'dislike_count', 'reply_count', 'user_id'), name='cmt_video_status_cov'),
+        ),
+        migrations.AddIndex(
+            model_name='interaction',
+            index=models.Index(fields=['video', 'type', 'timestamp'], include=('user_id', 'value'), name='interaction_video_type_cov'),
+        ),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+TARGET_FIELDS = {"video": "video_id", "comment": "comment_id", "user": "target_user_id"}
+
+
+def forwards_copy_targets(apps, schema_editor):
+    """Copy generic (content_type, object_id) targets into the concrete FKs"""
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    ct_fields = {
+        ct.pk: TARGET_FIELDS[ct.model]
+        for ct in ContentType.objects.filter(
+            app_label="core", model__in=TARGET_FIELDS
+        )
+    }
+    for model_name in ("Flag", "ModerationLog"):
+        model = apps.get_model("core", model_name)
+        for row in model.objects.all().iterator():
+            field = ct_fields.get(row.content_type_id)
+            if field is not None:
+                setattr(row, field, row.object_id)
+                row.save(update_fields=[field])
+
+
+def backwards_copy_targets(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    cts = {
+        TARGET_FIELDS[ct.model]: ct.pk
+        for ct in ContentType.objects.filter(
+            app_label="core", model__in=TARGET_FIELDS
+        )
+    }
+    for model_name in ("Flag", "ModerationLog"):
+        model = apps.get_model("core", model_name)
+        for row in model.objects.all().iterator():
+            for field, ct_pk in cts.items():
+                target_pk = getattr(row, field)
+                if target_pk is not None:
+                    row.content_type_id = ct_pk
+                    row.object_id = target_pk
+                    row.save(update_fields=["content_type", "object_id"])
+                    break
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_remove_comment_comments_video_i_68aa4f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='flag',
+            name='comment',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='flags', to='core.comment'),
+        ),
+        migrations.AddField(
+            model_name='flag',
+            name='target_user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='flags_received', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='flag',
+            name='video',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='flags', to='core.video'),
+        ),
+        migrations.AddField(
+            model_name='moderationlog',
+            name='comment',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='moderation_logs', to='core.comment'),
+        ),
+        migrations.AddField(
+            model_name='moderationlog',
+            name='target_user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='moderation_logs_received', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='moderationlog',
+            name='video',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='moderation_logs', to='core.video'),
+        ),
+        migrations.RunPython(forwards_copy_targets, backwards_copy_targets),
+        migrations.RemoveIndex(
+            model_name='flag',
+            name='flags_content_a6550a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='moderationlog',
+            name='moderation__content_414078_idx',
+        ),
+        migrations.RemoveField(
+            model_name='flag',
+            name='content_type',
+        ),
+        migrations.RemoveField(
+            model_name='flag',
+            name='object_id',
+        ),
+        migrations.RemoveField(
+            model_name='moderationlog',
+            name='content_type',
+        ),
+        migrations.RemoveField(
+            model_name='moderationlog',
+            name='object_id',
+        ),
+        migrations.AddConstraint(
+            model_name='flag',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('comment__isnull', True), ('target_user__isnull', True), ('video__isnull', False)), models.Q(('comment__isnull', False), ('target_user__isnull', True), ('video__isnull', True)), models.Q(('comment__isnull', True), ('target_user__isnull', False), ('video__isnull', True)), _connector='OR'), name='flag_one_target'),
+        ),
+        migrations.AddConstraint(
+            model_name='moderationlog',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('comment__isnull', True), ('target_user__isnull', True), ('video__isnull', False)), models.Q(('comment__isnull', False), ('target_user__isnull', True), ('video__isnull', True)), models.Q(('comment__isnull', True), ('target_user__isnull', False), ('video__isnull', True)), _connector='OR'), name='modlog_one_target'),
+        ),
+    ]
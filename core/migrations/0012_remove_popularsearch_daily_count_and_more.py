@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_remove_flag_flags_content_a6550a_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='popularsearch',
+            name='daily_count',
+        ),
+        migrations.RemoveField(
+            model_name='popularsearch',
+            name='monthly_count',
+        ),
+        migrations.RemoveField(
+            model_name='popularsearch',
+            name='weekly_count',
+        ),
+        migrations.CreateModel(
+            name='SearchCountBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateField()),
+                ('count', models.IntegerField(default=0)),
+                ('popular_search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='buckets', to='core.popularsearch')),
+            ],
+            options={
+                'db_table': 'search_count_buckets',
+                'ordering': ['-bucket'],
+                'indexes': [models.Index(fields=['bucket'], name='search_coun_bucket_a361af_idx')],
+                'unique_together': {('popular_search', 'bucket')},
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:53
+
+from django.db import migrations, models
+
+TYPE_CODES = {
+    "LIKE": 1,
+    "DISLIKE": 2,
+    "VIEW": 3,
+    "NOT_INTERESTED": 4,
+    "WATCH_TIME": 5,
+}
+
+
+def forwards_type_codes(apps, schema_editor):
+    Interaction = apps.get_model("core", "Interaction")
+    for name, code in TYPE_CODES.items():
+        Interaction.objects.filter(type=name).update(type=code)
+
+
+def backwards_type_codes(apps, schema_editor):
+    Interaction = apps.get_model("core", "Interaction")
+    for name, code in TYPE_CODES.items():
+        Interaction.objects.filter(type=code).update(type=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_remove_popularsearch_daily_count_and_more'),
+    ]
+
+    operations = [
+        # Map the old varchar values onto their codes while the column is
+        # still a CharField, then narrow the column type.
+        migrations.RunPython(forwards_type_codes, backwards_type_codes),
+        migrations.AlterField(
+            model_name='interaction',
+            name='type',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Like'), (2, 'Dislike'), (3, 'View'), (4, 'Not Interested'), (5, 'Watch Time')]),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:54
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_interaction_type_smallint'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='channelanalytics',
+            name='net_subscriber_change',
+        ),
+        migrations.AddField(
+            model_name='channelanalytics',
+            name='net_subscriber_change',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('new_subscribers'), '-', models.F('unsubscribers')), output_field=models.IntegerField()),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-09-01 20:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+
+
+def forwards_backfill_roots(apps, schema_editor):
+    """Anchor existing comments: replies to their parent (2-level
+    threading), top-level comments to themselves."""
+    Comment = apps.get_model("core", "Comment")
+    Comment.objects.filter(parent__isnull=False).update(
+        root_id=models.F("parent_id")
+    )
+    Comment.objects.filter(parent__isnull=True).update(root_id=models.F("id"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_channelanalytics_generated_net_change'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='root',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='thread', to='core.comment'),
+        ),
+        migrations.RunPython(forwards_backfill_roots, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['video', 'root', 'created_at'], name='comments_video_i_4e84cc_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_comment_thread_root'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('status', 'ACTIVE')), fields=['video', '-created_at'], name='cmt_active_video'),
+        ),
+        migrations.AddIndex(
+            model_name='flag',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['created_at'], name='flag_pending_queue'),
+        ),
+    ]
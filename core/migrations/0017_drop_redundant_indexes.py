@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_comment_cmt_active_video_flag_flag_pending_queue'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='channel',
+            name='channels_handle_5f25e1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='channel',
+            name='channels_subscri_7ac275_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='comments_parent__9f8798_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='flag',
+            name='flags_user_id_f364c2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='popularsearch',
+            name='popular_sea_query_9aeed0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='recommendationcache',
+            name='recommendat_user_id_a11853_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='subscription',
+            name='channel_sub_subscri_afe17f_idx',
+        ),
+    ]
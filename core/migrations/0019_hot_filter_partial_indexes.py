@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_drop_field_level_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='video',
+            name='published_public_videos_idx',
+        ),
+        migrations.AddIndex(
+            model_name='refreshtoken',
+            index=models.Index(condition=models.Q(('revoked', False)), fields=['user', 'expires_at'], name='refresh_active_tokens_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usersubscription',
+            index=models.Index(condition=models.Q(('status__in', ['ACTIVE', 'GRACE_PERIOD'])), fields=['renewal_date'], name='subs_renewal_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True), ('status', 'PUBLISHED'), ('visibility', 'PUBLIC')), fields=['-published_at'], include=('title', 'view_count', 'thumbnail_url'), name='published_public_videos_idx'),
+        ),
+    ]
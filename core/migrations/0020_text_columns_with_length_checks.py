@@ -0,0 +1,69 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:06
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_hot_filter_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='refreshtoken',
+            name='token',
+            field=models.TextField(unique=True),
+        ),
+        migrations.AlterField(
+            model_name='subtitle',
+            name='file_key',
+            field=models.TextField(help_text='S3 key for WebVTT file'),
+        ),
+        migrations.AlterField(
+            model_name='subtitle',
+            name='file_url',
+            field=models.TextField(validators=[django.core.validators.URLValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='video',
+            name='thumbnail_url',
+            field=models.TextField(blank=True, validators=[django.core.validators.URLValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='videoasset',
+            name='playlist_url',
+            field=models.TextField(help_text='Master or variant playlist URL', validators=[django.core.validators.URLValidator()]),
+        ),
+        migrations.AlterField(
+            model_name='videoasset',
+            name='segment_path_prefix',
+            field=models.TextField(help_text='S3 prefix for segment files'),
+        ),
+        migrations.AlterField(
+            model_name='videoversion',
+            name='source_object_key',
+            field=models.TextField(help_text='S3 object key for original upload'),
+        ),
+        migrations.AddConstraint(
+            model_name='refreshtoken',
+            constraint=models.CheckConstraint(condition=models.Q(('token__length__lte', 500)), name='refresh_token_len'),
+        ),
+        migrations.AddConstraint(
+            model_name='subtitle',
+            constraint=models.CheckConstraint(condition=models.Q(('file_key__length__lte', 500), ('file_url__length__lte', 500)), name='subtitle_paths_len'),
+        ),
+        migrations.AddConstraint(
+            model_name='video',
+            constraint=models.CheckConstraint(condition=models.Q(('thumbnail_url__length__lte', 500)), name='video_thumbnail_url_len'),
+        ),
+        migrations.AddConstraint(
+            model_name='videoasset',
+            constraint=models.CheckConstraint(condition=models.Q(('playlist_url__length__lte', 500), ('segment_path_prefix__length__lte', 500)), name='videoasset_paths_len'),
+        ),
+        migrations.AddConstraint(
+            model_name='videoversion',
+            constraint=models.CheckConstraint(condition=models.Q(('source_object_key__length__lte', 500)), name='videoversion_object_key_len'),
+        ),
+    ]
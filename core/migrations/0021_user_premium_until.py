@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_text_columns_with_length_checks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='premium_until',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_user_premium_until'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='promotionalcode',
+            index=models.Index(fields=['code'], include=('valid_from', 'valid_until', 'max_uses', 'current_uses', 'is_active'), name='promo_code_validation_cov'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:10
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_promo_code_atomic_consume'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='revenueshare',
+            name='creator_revenue_cents',
+        ),
+        migrations.AddField(
+            model_name='revenueshare',
+            name='creator_revenue_cents',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('total_revenue_cents'), '*', models.F('creator_share_percentage')), '/', models.Value(100)), output_field=models.IntegerField()),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:20
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def forwards_hash_tokens(apps, schema_editor):
+    """Digest existing raw tokens into the new binary column"""
+    for model_name in ("RefreshToken", "PasswordResetToken"):
+        model = apps.get_model("core", model_name)
+        rows = []
+        for row in model.objects.all().iterator():
+            row.token_hash = hashlib.sha256(row.token.encode()).digest()
+            rows.append(row)
+            if len(rows) >= 1000:
+                model.objects.bulk_update(rows, ["token_hash"])
+                rows = []
+        if rows:
+            model.objects.bulk_update(rows, ["token_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_revenueshare_generated_creator_cents'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='refreshtoken',
+            name='refresh_token_len',
+        ),
+        migrations.RemoveIndex(
+            model_name='refreshtoken',
+            name='refresh_tok_token_e21bac_idx',
+        ),
+        migrations.AddField(
+            model_name='refreshtoken',
+            name='token_hash',
+            field=models.BinaryField(max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='passwordresettoken',
+            name='token_hash',
+            field=models.BinaryField(max_length=32, null=True),
+        ),
+        # Raw tokens cannot be recovered from digests, so this is
+        # forward-only.
+        migrations.RunPython(forwards_hash_tokens, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='refreshtoken',
+            name='token',
+        ),
+        migrations.RemoveField(
+            model_name='passwordresettoken',
+            name='token',
+        ),
+        migrations.AlterField(
+            model_name='refreshtoken',
+            name='token_hash',
+            field=models.BinaryField(max_length=32, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='passwordresettoken',
+            name='token_hash',
+            field=models.BinaryField(max_length=32, unique=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_hashed_token_storage'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usersubscription',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='premium_subscriptions', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='usersubscription',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['ACTIVE', 'GRACE_PERIOD'])), fields=('user',), name='one_live_sub_per_user'),
+        ),
+    ]
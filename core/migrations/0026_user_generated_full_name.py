@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:16
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0025_live_subscription_constraint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(models.Q(('first_name', ''), ('last_name', '')), then=models.F('username')), default=django.db.models.functions.text.Trim(django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'))), output_field=models.CharField(max_length=201)),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['full_name'], name='user_full_name_idx'),
+        ),
+    ]
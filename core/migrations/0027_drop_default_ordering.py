@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:16
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_user_generated_full_name'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='creatorpayout',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='paymenttransaction',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='usersubscription',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='video',
+            options={},
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:17
+
+from django.db import migrations, models
+
+
+def create_created_at_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            'CREATE INDEX "payment_transactions_created_brin" ON '
+            '"payment_transactions" USING brin ("created_at") '
+            "WITH (pages_per_range = 32)"
+        )
+    else:
+        schema_editor.execute(
+            'CREATE INDEX "payment_transactions_created_brin" ON '
+            '"payment_transactions" ("created_at")'
+        )
+
+
+def drop_created_at_index(apps, schema_editor):
+    schema_editor.execute('DROP INDEX "payment_transactions_created_brin"')
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_drop_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='paymenttransaction',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.RunPython(create_created_at_index, drop_created_at_index),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-09-01 22:10
+
+from django.db import migrations
+
+# Under any non-C collation a plain b-tree cannot serve LIKE 'prefix%'
+# on PostgreSQL; varchar_pattern_ops compares byte-wise, which is what
+# the planner needs for the autocomplete prefix scan. Other backends'
+# LIKE optimizations work off the existing unique index.
+
+
+def create_pattern_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            'CREATE INDEX "popular_search_query_pattern_idx" ON '
+            '"popular_searches" ("query" varchar_pattern_ops)'
+        )
+
+
+def drop_pattern_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute('DROP INDEX "popular_search_query_pattern_idx"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0029_video_geo_restrictions_gin"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_pattern_index, drop_pattern_index),
+    ]
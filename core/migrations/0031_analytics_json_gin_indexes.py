@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-09-01 22:15
+
+from django.db import migrations
+
+# Containment filters on the analytics JSON payloads (e.g.
+# traffic_source_data__contains) seq-scan without a GIN index.
+# jsonb_path_ops ships with core PostgreSQL and is 2-3x smaller than
+# the default opclass; other backends have no GIN equivalent.
+JSON_GIN_INDEXES = [
+    ("channel_analytics", "traffic_source_data", "channel_analytics_traffic_gin"),
+    ("video_analytics", "demographics_data", "video_analytics_demo_gin"),
+]
+
+
+def create_json_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column, name in JSON_GIN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX "{name}" ON "{table}" '
+            f'USING gin ("{column}" jsonb_path_ops)'
+        )
+
+
+def drop_json_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column, name in JSON_GIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0030_popularsearch_query_pattern_ops"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_json_gin_indexes, drop_json_gin_indexes),
+    ]
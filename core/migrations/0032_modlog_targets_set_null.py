@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-09-01 21:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0031_analytics_json_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="moderationlog",
+            name="modlog_one_target",
+        ),
+        migrations.AlterField(
+            model_name="moderationlog",
+            name="comment",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="moderation_logs",
+                to="core.comment",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="moderationlog",
+            name="target_user",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="moderation_logs_received",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="moderationlog",
+            name="video",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="moderation_logs",
+                to="core.video",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="moderationlog",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(("comment__isnull", True), ("target_user__isnull", True)),
+                    models.Q(("target_user__isnull", True), ("video__isnull", True)),
+                    models.Q(("comment__isnull", True), ("video__isnull", True)),
+                    _connector="OR",
+                ),
+                name="modlog_one_target",
+            ),
+        ),
+    ]
@@ -1,3 +1,9 @@
+from django.db.models import TextField
+from django.db.models.functions import Length
+
+# Enables __length lookups for the TextField length CheckConstraints.
+TextField.register_lookup(Length)
+
 from .user import User, SocialAuth, RefreshToken, PasswordResetToken
 from .channel import Channel, Subscription
 from .video import Video, VideoVersion, VideoAsset, VideoTag, VideoTagRelation, Subtitle
@@ -17,8 +23,10 @@ from .analytics import (
     RecommendationCache,
     SearchQuery,
     PopularSearch,
+    SearchCountBucket,
     ChannelAnalytics,
     VideoAnalytics,
+    TrafficSourceBreakdown,
     UserWatchHistory,
 )
 
@@ -65,7 +73,9 @@ __all__ = [
     "RecommendationCache",
     "SearchQuery",
     "PopularSearch",
+    "SearchCountBucket",
     "ChannelAnalytics",
     "VideoAnalytics",
+    "TrafficSourceBreakdown",
     "UserWatchHistory",
 ]
@@ -1,8 +1,22 @@
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Lower, Trim
+from django.utils.functional import cached_property
+
+from core.managers.custom_managers import (
+    ChannelAnalyticsManager,
+    PopularSearchManager,
+    RecommendationCacheManager,
+    SearchQueryManager,
+    TrafficSourceBreakdownManager,
+    TrendingVideoManager,
+    UserWatchHistoryManager,
+    VideoAnalyticsManager,
+)
 
 
 class TrendingVideo(models.Model):
-    """Cached trending videos"""
+    """Cached trending videos, written in batches by the trending job"""
 
     video = models.ForeignKey(
         "Video", on_delete=models.CASCADE, related_name="trending_entries"
@@ -23,12 +37,18 @@ class TrendingVideo(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = TrendingVideoManager()
+
     class Meta:
         db_table = "trending_videos"
         ordering = ["date", "rank"]
         unique_together = [["video", "date", "region"]]
         indexes = [
-            models.Index(fields=["date", "region", "rank"]),
+            models.Index(
+                fields=["date", "region", "rank"],
+                include=["score", "video_id"],
+                name="trending_cov_idx",
+            ),
         ]
 
     def __str__(self):
@@ -36,7 +56,8 @@ class TrendingVideo(models.Model):
 
 
 class RecommendationCache(models.Model):
-    """Cached recommendations per user"""
+    """Cached recommendations per user, refreshed in batches via
+    RecommendationCache.objects.bulk_upsert()"""
 
     user = models.ForeignKey(
         "User", on_delete=models.CASCADE, related_name="recommendation_caches"
@@ -62,22 +83,19 @@ class RecommendationCache(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = RecommendationCacheManager()
+
     class Meta:
         db_table = "recommendation_caches"
         ordering = ["-updated_at"]
         unique_together = [["user", "context"]]
         indexes = [
-            models.Index(fields=["user", "context"]),
             models.Index(fields=["expires_at"]),
         ]
 
     def __str__(self):
         return f"{self.user.username} - {self.context}"
 
-    def get_video_ids(self):
-        """Get video IDs as a list"""
-        return self.video_ids if isinstance(self.video_ids, list) else []
-
     def set_video_ids(self, video_ids):
         """Set video IDs (limit to 50)"""
         self.video_ids = list(video_ids)[:50]
@@ -95,9 +113,10 @@ class SearchQuery(models.Model):
     )
 
     query = models.CharField(max_length=255, db_index=True)
-    normalized_query = models.CharField(
-        max_length=255,
-        db_index=True,
+    normalized_query = models.GeneratedField(
+        expression=Lower(Trim("query")),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
         help_text="Lowercase, trimmed version for grouping",
     )
 
@@ -116,7 +135,10 @@ class SearchQuery(models.Model):
     session_id = models.CharField(max_length=100, blank=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
 
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Indexed by a BRIN (time-ordered, append-only) — see migration 0009.
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = SearchQueryManager()
 
     class Meta:
         db_table = "search_queries"
@@ -129,12 +151,6 @@ class SearchQuery(models.Model):
     def __str__(self):
         return f"{self.query} - {self.created_at}"
 
-    def save(self, *args, **kwargs):
-        """Auto-normalize query on save"""
-        if not self.normalized_query:
-            self.normalized_query = self.query.lower().strip()
-        super().save(*args, **kwargs)
-
 
 class PopularSearch(models.Model):
     """Aggregated popular searches for autocomplete"""
@@ -144,25 +160,48 @@ class PopularSearch(models.Model):
     search_count = models.IntegerField(default=0)
     click_through_rate = models.FloatField(default=0.0)
 
-    # Time-based popularity
-    daily_count = models.IntegerField(default=0)
-    weekly_count = models.IntegerField(default=0)
-    monthly_count = models.IntegerField(default=0)
-
     last_searched_at = models.DateTimeField(auto_now=True)
 
+    objects = PopularSearchManager()
+
     class Meta:
         db_table = "popular_searches"
         ordering = ["-search_count"]
         indexes = [
             models.Index(fields=["-search_count"]),
-            models.Index(fields=["query"]),
         ]
 
     def __str__(self):
         return f"{self.query} ({self.search_count})"
 
 
+class SearchCountBucket(models.Model):
+    """Per-day search counts backing the popularity windows.
+
+    One bucketed counter replaces separate daily/weekly/monthly columns
+    and their three reset cadences; any window is a SUM over buckets
+    (see PopularSearchManager.with_window_counts).
+    """
+
+    popular_search = models.ForeignKey(
+        PopularSearch, on_delete=models.CASCADE, related_name="buckets"
+    )
+
+    bucket = models.DateField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "search_count_buckets"
+        ordering = ["-bucket"]
+        unique_together = [["popular_search", "bucket"]]
+        indexes = [
+            models.Index(fields=["bucket"]),
+        ]
+
+    def __str__(self):
+        return f"{self.popular_search.query} - {self.bucket} ({self.count})"
+
+
 class ChannelAnalytics(models.Model):
     """Daily aggregated channel analytics"""
 
@@ -188,7 +227,11 @@ class ChannelAnalytics(models.Model):
     # Subscribers
     new_subscribers = models.IntegerField(default=0)
     unsubscribers = models.IntegerField(default=0)
-    net_subscriber_change = models.IntegerField(default=0)
+    net_subscriber_change = models.GeneratedField(
+        expression=models.F("new_subscribers") - models.F("unsubscribers"),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
 
     # Revenue (in cents)
     estimated_revenue_cents = models.IntegerField(default=0)
@@ -200,6 +243,8 @@ class ChannelAnalytics(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ChannelAnalyticsManager()
+
     class Meta:
         db_table = "channel_analytics"
         ordering = ["-date"]
@@ -211,12 +256,22 @@ class ChannelAnalytics(models.Model):
     def __str__(self):
         return f"{self.channel.name} - {self.date}"
 
-    @property
+    def clean(self):
+        """Keep the traffic-source payload a flat source -> count mapping"""
+        if not isinstance(self.traffic_source_data, dict) or not all(
+            isinstance(k, str) and isinstance(v, int)
+            for k, v in self.traffic_source_data.items()
+        ):
+            raise ValidationError(
+                {"traffic_source_data": "Expected a mapping of source name to count."}
+            )
+
+    @cached_property
     def estimated_revenue(self):
         """Get revenue in dollars"""
         return self.estimated_revenue_cents / 100
 
-    @property
+    @cached_property
     def average_watch_time_minutes(self):
         """Get average watch time in minutes"""
         return (
@@ -260,46 +315,112 @@ class VideoAnalytics(models.Model):
         default=dict, help_text="Age, gender, location breakdown"
     )
 
-    # Traffic sources
-    traffic_sources = models.JSONField(
-        default=dict, help_text="Where viewers came from"
-    )
-
     # Revenue (in cents)
     estimated_revenue_cents = models.IntegerField(default=0)
 
+    # Engagement rate in basis points, computed by the database at write
+    # time (integer to keep the index free of floating point).
+    engagement_rate_scaled = models.GeneratedField(
+        expression=models.Case(
+            models.When(views=0, then=0),
+            default=(
+                models.F("likes")
+                + models.F("dislikes")
+                + models.F("comments")
+                + models.F("shares")
+            )
+            * 10000
+            / models.F("views"),
+        ),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = VideoAnalyticsManager()
+
     class Meta:
         db_table = "video_analytics"
         ordering = ["-date"]
         unique_together = [["video", "date"]]
         indexes = [
-            models.Index(fields=["video", "date"]),
+            models.Index(
+                fields=["video", "date"],
+                include=["views", "watch_time_seconds", "estimated_revenue_cents"],
+                name="video_analytics_cov_idx",
+            ),
+            models.Index(fields=["-engagement_rate_scaled"]),
         ]
 
     def __str__(self):
         return f"{self.video.title} - {self.date}"
 
-    @property
+    DEMOGRAPHICS_KEYS = frozenset({"age", "gender", "location"})
+
+    def clean(self):
+        """Bound the JSON payloads so rows stay compact"""
+        if not isinstance(self.demographics_data, dict) or not (
+            self.DEMOGRAPHICS_KEYS >= self.demographics_data.keys()
+        ):
+            raise ValidationError(
+                {
+                    "demographics_data": (
+                        "Expected a mapping with only age/gender/location breakdowns."
+                    )
+                }
+            )
+
+    @cached_property
     def estimated_revenue(self):
         """Get revenue in dollars"""
         return self.estimated_revenue_cents / 100
 
     @property
     def engagement_rate(self):
-        """Calculate engagement rate"""
+        """Engagement rate as a percentage"""
+        if not self._state.adding and self.engagement_rate_scaled is not None:
+            return self.engagement_rate_scaled / 100
+        # Unsaved instances don't have the generated column yet.
         if self.views == 0:
             return 0.0
         total_engagement = self.likes + self.dislikes + self.comments + self.shares
         return (total_engagement / self.views) * 100
 
-    @property
+    @cached_property
     def watch_time_hours(self):
         """Get watch time in hours"""
         return self.watch_time_seconds / 3600 if self.watch_time_seconds else 0
 
 
+class TrafficSourceBreakdown(models.Model):
+    """Per-source traffic rows for a day's video analytics.
+
+    Replaces the traffic_sources JSON blob with typed rows so dashboard
+    GROUP BYs run on indexed columns instead of parsing JSON per row.
+    """
+
+    analytics = models.ForeignKey(
+        VideoAnalytics, on_delete=models.CASCADE, related_name="traffic_source_rows"
+    )
+
+    source = models.CharField(max_length=50)
+    views = models.IntegerField(default=0)
+
+    objects = TrafficSourceBreakdownManager()
+
+    class Meta:
+        db_table = "video_analytics_traffic_sources"
+        ordering = ["-views"]
+        unique_together = [["analytics", "source"]]
+        indexes = [
+            models.Index(fields=["source"]),
+        ]
+
+    def __str__(self):
+        return f"{self.analytics} - {self.source} ({self.views})"
+
+
 class UserWatchHistory(models.Model):
     """User watch history for recommendations"""
 
@@ -318,9 +439,12 @@ class UserWatchHistory(models.Model):
     # Last position for resume
     last_position_seconds = models.IntegerField(default=0)
 
-    watched_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Indexed by a BRIN (time-ordered, append-only) — see migration 0009.
+    watched_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserWatchHistoryManager()
+
     class Meta:
         db_table = "user_watch_history"
         ordering = ["-watched_at"]
@@ -328,6 +452,11 @@ class UserWatchHistory(models.Model):
         indexes = [
             models.Index(fields=["user", "-watched_at"]),
             models.Index(fields=["video", "watched_at"]),
+            models.Index(
+                fields=["user", "completed"],
+                name="watch_history_completed_idx",
+                condition=models.Q(watch_percentage__gte=90.0),
+            ),
         ]
 
     def __str__(self):
@@ -335,9 +464,12 @@ class UserWatchHistory(models.Model):
 
     def mark_completed(self):
         """Mark video as completed if watch percentage > 90%"""
-        if self.watch_percentage >= 90.0:
+        updated = UserWatchHistory.objects.filter(
+            pk=self.pk, watch_percentage__gte=90.0
+        ).update(completed=True)
+        if updated:
             self.completed = True
-            self.save(update_fields=["completed"])
+        return updated
 
     @property
     def watch_duration_minutes(self):
@@ -1,5 +1,7 @@
 from django.db import models
 from django.core.validators import MinLengthValidator
+from django_fast_count.managers import FastCountManager
+from core.managers.custom_managers import ChannelQuerySet
 from .choices import ChannelStatus
 
 
@@ -38,50 +40,61 @@ class Channel(models.Model):
     monetization_enabled = models.BooleanField(default=False)
     monetization_enabled_at = models.DateTimeField(null=True, blank=True)
 
-    # Quotas (based on subscriber count)
-    max_videos_per_week = models.IntegerField(default=10)
-    max_video_duration_minutes = models.IntegerField(default=15)
-    max_file_size_gb = models.IntegerField(default=2)
-
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    objects = ChannelQuerySet.as_manager()
+
     class Meta:
         db_table = "channels"
         ordering = ["-subscriber_count", "-created_at"]
         indexes = [
-            models.Index(fields=["handle"]),
             models.Index(fields=["status", "verified"]),
-            models.Index(fields=["subscriber_count"]),
+            models.Index(
+                fields=["-subscriber_count"],
+                name="active_channels_idx",
+                condition=models.Q(status="ACTIVE", deleted_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
         return f"{self.name} (@{self.handle})"
 
-    def update_quotas(self):
-        """Update upload quotas based on subscriber count"""
-        if self.subscriber_count >= 1000:
-            self.max_videos_per_week = 999999  # Unlimited
-            self.max_video_duration_minutes = 720  # 12 hours
-            self.max_file_size_gb = 50
-        else:
-            self.max_videos_per_week = 10
-            self.max_video_duration_minutes = 15
-            self.max_file_size_gb = 2
-        self.save()
+    # Upload quotas are a pure function of subscriber_count (threshold
+    # 1000); deriving them avoids rewriting three columns per subscribe.
+    @property
+    def max_videos_per_week(self):
+        return 999999 if self.subscriber_count >= 1000 else 10  # Unlimited
+
+    @property
+    def max_video_duration_minutes(self):
+        return 720 if self.subscriber_count >= 1000 else 15  # 12 hours
+
+    @property
+    def max_file_size_gb(self):
+        return 50 if self.subscriber_count >= 1000 else 2
 
     def increment_subscriber_count(self):
-        self.subscriber_count = models.F("subscriber_count") + 1
-        self.save()
-        self.refresh_from_db()
-        self.update_quotas()
+        Channel.objects.filter(pk=self.pk).update(
+            subscriber_count=models.F("subscriber_count") + 1
+        )
+        self.subscriber_count = (
+            Channel.objects.filter(pk=self.pk)
+            .values_list("subscriber_count", flat=True)
+            .first()
+        )
 
     def decrement_subscriber_count(self):
-        self.subscriber_count = models.F("subscriber_count") - 1
-        self.save()
-        self.refresh_from_db()
+        Channel.objects.filter(pk=self.pk).update(
+            subscriber_count=models.F("subscriber_count") - 1
+        )
+        self.subscriber_count = (
+            Channel.objects.filter(pk=self.pk)
+            .values_list("subscriber_count", flat=True)
+            .first()
+        )
 
 
 class Subscription(models.Model):
@@ -99,12 +112,13 @@ class Subscription(models.Model):
 
     subscribed_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
+    objects = FastCountManager()
+
     class Meta:
         db_table = "channel_subscriptions"
         unique_together = [["subscriber", "channel"]]
         ordering = ["-subscribed_at"]
         indexes = [
-            models.Index(fields=["subscriber", "channel"]),
             models.Index(fields=["channel", "subscribed_at"]),
         ]
 
@@ -53,12 +53,14 @@ class VideoResolution(models.TextChoices):
     RES_1440P = "1440p", "1440p (2560x1440)"
 
 
-class InteractionType(models.TextChoices):
-    LIKE = "LIKE", "Like"
-    DISLIKE = "DISLIKE", "Dislike"
-    VIEW = "VIEW", "View"
-    NOT_INTERESTED = "NOT_INTERESTED", "Not Interested"
-    WATCH_TIME = "WATCH_TIME", "Watch Time"
+class InteractionType(models.IntegerChoices):
+    # Stored as a smallint: interactions is by far the largest table, and
+    # 2 bytes per row beats a 4-20 byte varchar on heap and index pages.
+    LIKE = 1, "Like"
+    DISLIKE = 2, "Dislike"
+    VIEW = 3, "View"
+    NOT_INTERESTED = 4, "Not Interested"
+    WATCH_TIME = 5, "Watch Time"
 
 
 class CommentStatus(models.TextChoices):
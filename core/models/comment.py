@@ -1,4 +1,5 @@
 from django.db import models
+from core.managers.custom_managers import CommentManager
 from .choices import CommentStatus
 
 
@@ -15,6 +16,13 @@ class Comment(models.Model):
         "self", on_delete=models.CASCADE, null=True, blank=True, related_name="replies"
     )
 
+    # Materialized thread anchor (the top-level comment, or self): whole
+    # threads load with one root_id range scan instead of recursive
+    # parent self-joins.
+    root = models.ForeignKey(
+        "self", on_delete=models.CASCADE, null=True, blank=True, related_name="thread"
+    )
+
     text = models.TextField(max_length=2000)
 
     status = models.CharField(
@@ -30,22 +38,51 @@ class Comment(models.Model):
     edited = models.BooleanField(default=False)
     edited_at = models.DateTimeField(null=True, blank=True)
 
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    objects = CommentManager()
+
     class Meta:
         db_table = "comments"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["video", "status", "created_at"]),
+            # Covers the visible-comments page (top-N by recency) so it can
+            # run as an index-only scan; text stays out to keep the index slim.
+            models.Index(
+                fields=["video", "status", "-created_at"],
+                include=["like_count", "dislike_count", "reply_count", "user_id"],
+                name="cmt_video_status_cov",
+            ),
             models.Index(fields=["user", "created_at"]),
-            models.Index(fields=["parent"]),
+            models.Index(fields=["video", "root", "created_at"]),
+            models.Index(
+                fields=["video", "-created_at"],
+                name="cmt_active_video",
+                condition=models.Q(status="ACTIVE", deleted_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
         return f"{self.user.username} on {self.video.title}"
 
+    def save(self, *args, **kwargs):
+        """Anchor the comment to its thread root on first save"""
+        if self.root_id is None and self.parent_id is not None:
+            self.root_id = (
+                Comment.objects.filter(pk=self.parent_id)
+                .values_list("root_id", flat=True)
+                .first()
+                or self.parent_id
+            )
+        super().save(*args, **kwargs)
+        if self.root_id is None:
+            # Top-level comments anchor their own thread; the pk only
+            # exists after the insert.
+            self.root_id = self.pk
+            super().save(update_fields=["root"])
+
     @property
     def is_reply(self):
         return self.parent is not None
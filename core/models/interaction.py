@@ -1,5 +1,6 @@
 from django.db import models
 from django.core.validators import MinValueValidator
+from core.managers.custom_managers import InteractionManager, WatchSessionManager
 from .choices import InteractionType
 
 
@@ -17,7 +18,7 @@ class Interaction(models.Model):
         "Video", on_delete=models.CASCADE, related_name="interactions"
     )
 
-    type = models.CharField(max_length=20, choices=InteractionType.choices)
+    type = models.PositiveSmallIntegerField(choices=InteractionType.choices)
 
     # For WATCH_TIME type
     value = models.IntegerField(
@@ -30,20 +31,27 @@ class Interaction(models.Model):
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.CharField(max_length=500, blank=True)
 
-    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Indexed by a BRIN (time-ordered, append-only) — see migration 0009.
+    timestamp = models.DateTimeField(auto_now_add=True)
+
+    objects = InteractionManager()
 
     class Meta:
         db_table = "interactions"
         ordering = ["-timestamp"]
         indexes = [
-            models.Index(fields=["video", "type", "timestamp"]),
+            models.Index(
+                fields=["video", "type", "timestamp"],
+                include=["user_id", "value"],
+                name="interaction_video_type_cov",
+            ),
             models.Index(fields=["user", "video", "type"]),
             models.Index(fields=["session_id"]),
         ]
 
     def __str__(self):
         user_str = self.user.username if self.user else "Anonymous"
-        return f"{user_str} - {self.type} - {self.video.title}"
+        return f"{user_str} - {self.get_type_display()} - {self.video.title}"
 
 
 class WatchSession(models.Model):
@@ -85,6 +93,8 @@ class WatchSession(models.Model):
     started_at = models.DateTimeField(auto_now_add=True)
     ended_at = models.DateTimeField(null=True, blank=True)
 
+    objects = WatchSessionManager()
+
     class Meta:
         db_table = "watch_sessions"
         ordering = ["-started_at"]
@@ -1,16 +1,60 @@
 from django.db import models
-from django.contrib.contenttypes.fields import GenericForeignKey
-from django.contrib.contenttypes.models import ContentType
 from .choices import FlagReason, FlagStatus, ModerationAction
 
 
+def _one_target_constraint(name):
+    """Exactly one of video/comment/target_user must be set"""
+    return models.CheckConstraint(
+        condition=(
+            models.Q(
+                video__isnull=False, comment__isnull=True, target_user__isnull=True
+            )
+            | models.Q(
+                video__isnull=True, comment__isnull=False, target_user__isnull=True
+            )
+            | models.Q(
+                video__isnull=True, comment__isnull=True, target_user__isnull=False
+            )
+        ),
+        name=name,
+    )
+
+
+def _at_most_one_target_constraint(name):
+    """At most one of video/comment/target_user may be set.
+
+    The relaxed form for audit tables whose target FKs null out when
+    the content is deleted: rows keep at most one live target but may
+    outlive it.
+    """
+    return models.CheckConstraint(
+        condition=(
+            models.Q(comment__isnull=True, target_user__isnull=True)
+            | models.Q(video__isnull=True, target_user__isnull=True)
+            | models.Q(video__isnull=True, comment__isnull=True)
+        ),
+        name=name,
+    )
+
+
 class Flag(models.Model):
     """Content flagging system (videos, comments, users)"""
 
-    # Generic relation to flag any content type
-    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
-    object_id = models.PositiveIntegerField()
-    content_object = GenericForeignKey("content_type", "object_id")
+    # Concrete nullable FKs (exactly one set) instead of a generic
+    # relation: JOINable, select_related-able, no ContentType lookups.
+    video = models.ForeignKey(
+        "Video", on_delete=models.CASCADE, null=True, blank=True, related_name="flags"
+    )
+    comment = models.ForeignKey(
+        "Comment", on_delete=models.CASCADE, null=True, blank=True, related_name="flags"
+    )
+    target_user = models.ForeignKey(
+        "User",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="flags_received",
+    )
 
     # Flagger
     user = models.ForeignKey(
@@ -35,19 +79,29 @@ class Flag(models.Model):
     reviewed_at = models.DateTimeField(null=True, blank=True)
     review_notes = models.TextField(blank=True)
 
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "flags"
         ordering = ["-created_at"]
+        constraints = [_one_target_constraint("flag_one_target")]
         indexes = [
-            models.Index(fields=["content_type", "object_id"]),
             models.Index(fields=["status", "created_at"]),
-            models.Index(fields=["user"]),
+            # The moderator queue only ever scans PENDING flags.
+            models.Index(
+                fields=["created_at"],
+                name="flag_pending_queue",
+                condition=models.Q(status="PENDING"),
+            ),
         ]
 
     def __str__(self):
-        return f"Flag: {self.reason} on {self.content_type}"
+        return f"Flag: {self.reason} on {self.target}"
+
+    @property
+    def target(self):
+        """The flagged object (video, comment, or user)"""
+        return self.video or self.comment or self.target_user
 
 
 class ModerationLog(models.Model):
@@ -57,10 +111,30 @@ class ModerationLog(models.Model):
         "User", on_delete=models.SET_NULL, null=True, related_name="moderation_actions"
     )
 
-    # Target (video, comment, user, etc.)
-    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
-    object_id = models.PositiveIntegerField()
-    content_object = GenericForeignKey("content_type", "object_id")
+    # Target (at most one of video, comment, user). SET_NULL, not
+    # CASCADE: the audit trail must survive deletion of its target,
+    # matching the moderator FK and the old generic-relation behavior.
+    video = models.ForeignKey(
+        "Video",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="moderation_logs",
+    )
+    comment = models.ForeignKey(
+        "Comment",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="moderation_logs",
+    )
+    target_user = models.ForeignKey(
+        "User",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="moderation_logs_received",
+    )
 
     action = models.CharField(max_length=30, choices=ModerationAction.choices)
 
@@ -75,20 +149,25 @@ class ModerationLog(models.Model):
     duration_days = models.IntegerField(null=True, blank=True)
     expires_at = models.DateTimeField(null=True, blank=True)
 
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = "moderation_logs"
         ordering = ["-created_at"]
+        constraints = [_at_most_one_target_constraint("modlog_one_target")]
         indexes = [
             models.Index(fields=["moderator", "created_at"]),
-            models.Index(fields=["content_type", "object_id"]),
             models.Index(fields=["action", "created_at"]),
         ]
 
     def __str__(self):
         return f"{self.action} by {self.moderator.username if self.moderator else 'System'}"
 
+    @property
+    def target(self):
+        """The moderated object (video, comment, or user)"""
+        return self.video or self.comment or self.target_user
+
 
 class UserSuspension(models.Model):
     """Track user suspensions"""
@@ -1,5 +1,6 @@
 from django.db import models
 from django.core.validators import MinValueValidator
+from core.managers.custom_managers import CreatorPayoutManager, RevenueShareManager
 from .choices import PayoutStatus
 
 
@@ -47,9 +48,10 @@ class CreatorPayout(models.Model):
     notes = models.TextField(blank=True)
     failure_reason = models.TextField(blank=True)
 
+    objects = CreatorPayoutManager()
+
     class Meta:
         db_table = "creator_payouts"
-        ordering = ["-period_end", "-created_at"]
         unique_together = [["channel", "period_start", "period_end"]]
         indexes = [
             models.Index(fields=["channel", "status"]),
@@ -90,10 +92,19 @@ class RevenueShare(models.Model):
     creator_share_percentage = models.DecimalField(
         max_digits=5, decimal_places=2, default=70.00, validators=[MinValueValidator(0)]
     )
-    creator_revenue_cents = models.IntegerField(default=0)
+    # Computed by the database so ingest never recalculates it client-side.
+    creator_revenue_cents = models.GeneratedField(
+        expression=models.F("total_revenue_cents")
+        * models.F("creator_share_percentage")
+        / 100,
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = RevenueShareManager()
+
     class Meta:
         db_table = "revenue_shares"
         ordering = ["-date"]
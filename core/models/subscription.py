@@ -1,7 +1,14 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 from django.core.validators import MinValueValidator
 from django.utils import timezone
+from core.managers.custom_managers import (
+    PaymentTransactionQuerySet,
+    SubscriptionPlanManager,
+    UserSubscriptionQuerySet,
+)
 from .choices import SubscriptionPlanType, SubscriptionStatus, PaymentGateway
+from .user import User
 
 
 class SubscriptionPlan(models.Model):
@@ -32,6 +39,8 @@ class SubscriptionPlan(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SubscriptionPlanManager()
+
     class Meta:
         db_table = "subscription_plans"
         ordering = ["price_monthly_cents"]
@@ -40,11 +49,18 @@ class SubscriptionPlan(models.Model):
         return f"{self.name} - {self.plan_type}"
 
 
+post_save.connect(SubscriptionPlanManager.invalidate_cache, sender=SubscriptionPlan)
+post_delete.connect(SubscriptionPlanManager.invalidate_cache, sender=SubscriptionPlan)
+
+
 class UserSubscription(models.Model):
     """User's active subscription"""
 
-    user = models.OneToOneField(
-        "User", on_delete=models.CASCADE, related_name="active_subscription"
+    # Plain FK + partial unique constraint: the database guarantees at
+    # most one live (ACTIVE/GRACE_PERIOD) subscription per user while
+    # keeping expired history rows, with no guard SELECT needed.
+    user = models.ForeignKey(
+        "User", on_delete=models.CASCADE, related_name="premium_subscriptions"
     )
     plan = models.ForeignKey(
         SubscriptionPlan, on_delete=models.PROTECT, related_name="subscriptions"
@@ -76,24 +92,69 @@ class UserSubscription(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserSubscriptionQuerySet.as_manager()
+
     class Meta:
         db_table = "user_subscriptions"
-        ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(
+                    status__in=[
+                        SubscriptionStatus.ACTIVE,
+                        SubscriptionStatus.GRACE_PERIOD,
+                    ]
+                ),
+                name="one_live_sub_per_user",
+            ),
+        ]
         indexes = [
             models.Index(fields=["user", "status"]),
             models.Index(fields=["status", "renewal_date"]),
+            # Billing sweeps only scan subscriptions that can still renew.
+            models.Index(
+                fields=["renewal_date"],
+                name="subs_renewal_active_idx",
+                condition=models.Q(status__in=["ACTIVE", "GRACE_PERIOD"]),
+            ),
         ]
 
     def __str__(self):
         return f"{self.user.username} - {self.plan.name}"
 
+    def save(self, *args, **kwargs):
+        """Keep the user's denormalized premium window in sync.
+
+        The gateway webhook handler saves this row on every billing
+        event; mirroring the window onto User.premium_until here keeps
+        is_premium a local column read with no subscription join. The
+        window is recomputed from the user's live subscription — not
+        from self — so editing a historical row (admin included) cannot
+        clear an active user's premium.
+        """
+        super().save(*args, **kwargs)
+        live = UserSubscription.objects.filter(
+            user_id=self.user_id,
+            status__in=[SubscriptionStatus.ACTIVE, SubscriptionStatus.GRACE_PERIOD],
+        ).first()  # at most one, per one_live_sub_per_user
+        if live is None:
+            premium_until = None
+        elif live.status == SubscriptionStatus.ACTIVE:
+            premium_until = live.end_date or live.renewal_date
+        else:
+            premium_until = live.grace_period_ends_at
+        User.objects.filter(pk=self.user_id).update(premium_until=premium_until)
+
     @property
     def is_active(self):
-        now = timezone.now()
+        # Batch paths annotate this via with_active_flag(); fall back to
+        # the Python evaluation for bare instances.
+        if "is_active_db" in self.__dict__:
+            return self.is_active_db
         if self.status == SubscriptionStatus.ACTIVE:
             return True
         if self.status == SubscriptionStatus.GRACE_PERIOD and self.grace_period_ends_at:
-            return now < self.grace_period_ends_at
+            return timezone.now() < self.grace_period_ends_at
         return False
 
 
@@ -131,12 +192,14 @@ class PaymentTransaction(models.Model):
     failure_reason = models.TextField(blank=True)
 
     # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Indexed by a BRIN (time-ordered, append-only) — see migration 0028.
+    created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
+    objects = PaymentTransactionQuerySet.as_manager()
+
     class Meta:
         db_table = "payment_transactions"
-        ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["user", "status"]),
             models.Index(fields=["gateway_transaction_id"]),
@@ -180,10 +243,76 @@ class PromotionalCode(models.Model):
     class Meta:
         db_table = "promotional_codes"
         ordering = ["-created_at"]
+        indexes = [
+            # Covers checkout validation so the lookup is index-only.
+            models.Index(
+                fields=["code"],
+                include=[
+                    "valid_from",
+                    "valid_until",
+                    "max_uses",
+                    "current_uses",
+                    "is_active",
+                ],
+                name="promo_code_validation_cov",
+            ),
+        ]
 
     def __str__(self):
         return self.code
 
+    @classmethod
+    def consume(cls, code, user, amount_cents=0):
+        """Atomically claim one use of a code and log it.
+
+        The validity window and global max-uses guard ride in the
+        UPDATE's WHERE clause, so two concurrent redemptions can never
+        both claim the last use and the counter needs no
+        read-modify-write cycle. The claiming UPDATE also serializes
+        same-code redemptions for the transaction's duration, which
+        makes the per-user cap check race-free. Returns the
+        PromoCodeUsage (with the discount computed against
+        amount_cents) on success, None if the code is unknown,
+        inactive, outside its window, exhausted, or already used up by
+        this user.
+        """
+        from django.db import transaction
+
+        now = timezone.now()
+        with transaction.atomic():
+            claimed = (
+                cls.objects.filter(
+                    code=code,
+                    is_active=True,
+                    valid_from__lte=now,
+                    valid_until__gte=now,
+                )
+                .filter(
+                    models.Q(max_uses__isnull=True)
+                    | models.Q(current_uses__lt=models.F("max_uses"))
+                )
+                .update(current_uses=models.F("current_uses") + 1)
+            )
+            if not claimed:
+                return None
+            promo = cls.objects.get(code=code)
+            user_uses = PromoCodeUsage.objects.filter(
+                promo_code=promo, user=user
+            ).count()
+            if user_uses >= promo.max_uses_per_user:
+                # Release the globally claimed use.
+                cls.objects.filter(pk=promo.pk).update(
+                    current_uses=models.F("current_uses") - 1
+                )
+                return None
+            if promo.discount_type == "fixed":
+                discount = promo.discount_value
+            else:
+                discount = amount_cents * promo.discount_value // 100
+            return PromoCodeUsage.objects.create(
+                promo_code=promo, user=user, discount_applied_cents=discount
+            )
+
     @property
     def is_valid(self):
         now = timezone.now()
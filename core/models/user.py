@@ -1,12 +1,15 @@
+import hashlib
+
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
     PermissionsMixin,
 )
 from django.db import models
+from django.db.models.functions import Concat, Trim
 from django.utils import timezone
 from django.core.validators import MinLengthValidator
-from .choices import UserRole, UserStatus, LanguageCode
+from .choices import UserRole, UserStatus, LanguageCode, SubscriptionStatus
 
 
 class CustomUserManager(BaseUserManager):
@@ -30,6 +33,48 @@ class CustomUserManager(BaseUserManager):
 
         return self.create_user(email, username, password, **extra_fields)
 
+    def with_subscription(self):
+        """Prefetch the live premium subscription (with plan) per user"""
+        from .subscription import UserSubscription
+
+        return self.prefetch_related(
+            models.Prefetch(
+                "premium_subscriptions",
+                queryset=UserSubscription.objects.filter(
+                    status__in=[
+                        SubscriptionStatus.ACTIVE,
+                        SubscriptionStatus.GRACE_PERIOD,
+                    ]
+                ).select_related("plan"),
+                to_attr="live_subscriptions",
+            )
+        )
+
+    def public_fields(self):
+        """Narrow to the public-profile projection (no bio/security columns)"""
+        return self.only(
+            "id", "username", "first_name", "last_name", "avatar_url", "premium_until"
+        )
+
+    def bulk_soft_delete(self, user_ids):
+        """Soft-delete many accounts in two statements.
+
+        One UPDATE marks the users deleted, one revokes all of their
+        outstanding refresh tokens — instead of a save() round-trip per
+        user plus one per token. Returns the number of users deleted.
+        """
+        now = timezone.now()
+        deleted = self.filter(pk__in=user_ids, deleted_at__isnull=True).update(
+            deleted_at=now,
+            status=UserStatus.DELETED,
+            is_active=False,
+            premium_until=None,
+        )
+        RefreshToken.objects.filter(user_id__in=user_ids, revoked=False).update(
+            revoked=True, revoked_at=now
+        )
+        return deleted
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     email = models.EmailField(unique=True, max_length=255, db_index=True)
@@ -40,6 +85,20 @@ class User(AbstractBaseUser, PermissionsMixin):
     # Profile
     first_name = models.CharField(max_length=100, blank=True)
     last_name = models.CharField(max_length=100, blank=True)
+    # Display name computed in the database: serializers render it on
+    # every author card without a per-row Python string build, and name
+    # search gets an indexable column.
+    full_name = models.GeneratedField(
+        expression=models.Case(
+            models.When(
+                models.Q(first_name="") & models.Q(last_name=""),
+                then=models.F("username"),
+            ),
+            default=Trim(Concat("first_name", models.Value(" "), "last_name")),
+        ),
+        output_field=models.CharField(max_length=201),
+        db_persist=True,
+    )
     birthdate = models.DateField(null=True, blank=True)
     avatar_url = models.URLField(max_length=500, blank=True)
     bio = models.TextField(max_length=500, blank=True)
@@ -65,6 +124,10 @@ class User(AbstractBaseUser, PermissionsMixin):
     )
     email_notifications_enabled = models.BooleanField(default=True)
 
+    # Denormalized premium window, kept in sync by UserSubscription.save()
+    # from the payment-gateway webhook flow; auth checks never join.
+    premium_until = models.DateTimeField(null=True, blank=True, db_index=True)
+
     # Metadata
     is_staff = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
@@ -87,24 +150,35 @@ class User(AbstractBaseUser, PermissionsMixin):
             models.Index(fields=["email", "status"]),
             models.Index(fields=["username"]),
             models.Index(fields=["role", "status"]),
+            models.Index(fields=["full_name"], name="user_full_name_idx"),
         ]
 
     def __str__(self):
         return f"{self.username} ({self.email})"
 
-    @property
-    def full_name(self):
-        return f"{self.first_name} {self.last_name}".strip() or self.username
-
     @property
     def is_creator(self):
         return self.role in [UserRole.CREATOR, UserRole.ADMIN]
 
     @property
     def is_premium(self):
-        return (
-            hasattr(self, "active_subscription") and self.active_subscription.is_active
-        )
+        # Local column only — no subscription join on the auth path.
+        return self.premium_until is not None and self.premium_until > timezone.now()
+
+    @property
+    def active_subscription(self):
+        """The live premium subscription, if any.
+
+        The one_live_sub_per_user constraint guarantees at most one row;
+        load users via User.objects.with_subscription() to avoid a
+        per-user query here.
+        """
+        live = getattr(self, "live_subscriptions", None)
+        if live is not None:
+            return live[0] if live else None
+        return self.premium_subscriptions.filter(
+            status__in=[SubscriptionStatus.ACTIVE, SubscriptionStatus.GRACE_PERIOD]
+        ).first()
 
     def soft_delete(self):
         self.deleted_at = timezone.now()
@@ -141,13 +215,18 @@ class SocialAuth(models.Model):
 
 
 class RefreshToken(models.Model):
-    """JWT Refresh Token Management"""
+    """JWT Refresh Token Management.
+
+    Only the SHA-256 digest of the raw token is stored: a 32-byte
+    unique key keeps the index small, keeps secrets out of the table,
+    and makes lookups constant-time comparisons.
+    """
 
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="refresh_tokens"
     )
 
-    token = models.CharField(max_length=500, unique=True, db_index=True)
+    token_hash = models.BinaryField(max_length=32, unique=True)
     expires_at = models.DateTimeField()
     revoked = models.BooleanField(default=False)
     revoked_at = models.DateTimeField(null=True, blank=True)
@@ -162,12 +241,31 @@ class RefreshToken(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["user", "revoked"]),
-            models.Index(fields=["token"]),
+            # Session validation only ever touches unrevoked tokens.
+            models.Index(
+                fields=["user", "expires_at"],
+                name="refresh_active_tokens_idx",
+                condition=models.Q(revoked=False),
+            ),
         ]
 
     def __str__(self):
         return f"Token for {self.user.username}"
 
+    @staticmethod
+    def hash_token(raw_token):
+        """Digest a raw token for storage or lookup"""
+        return hashlib.sha256(raw_token.encode()).digest()
+
+    @classmethod
+    def for_raw_token(cls, raw_token):
+        """Resolve the presented token via its digest, or None"""
+        return (
+            cls.objects.filter(token_hash=cls.hash_token(raw_token))
+            .only("id", "user_id", "revoked", "expires_at")
+            .first()
+        )
+
     @property
     def is_valid(self):
         return not self.revoked and self.expires_at > timezone.now()
@@ -185,7 +283,7 @@ class PasswordResetToken(models.Model):
         User, on_delete=models.CASCADE, related_name="password_reset_tokens"
     )
 
-    token = models.CharField(max_length=100, unique=True, db_index=True)
+    token_hash = models.BinaryField(max_length=32, unique=True)
     expires_at = models.DateTimeField()
     used = models.BooleanField(default=False)
     used_at = models.DateTimeField(null=True, blank=True)
@@ -196,6 +294,16 @@ class PasswordResetToken(models.Model):
         db_table = "password_reset_tokens"
         ordering = ["-created_at"]
 
+    @staticmethod
+    def hash_token(raw_token):
+        """Digest a raw token for storage or lookup"""
+        return hashlib.sha256(raw_token.encode()).digest()
+
+    @classmethod
+    def for_raw_token(cls, raw_token):
+        """Resolve the presented token via its digest, or None"""
+        return cls.objects.filter(token_hash=cls.hash_token(raw_token)).first()
+
     @property
     def is_valid(self):
         return not self.used and self.expires_at > timezone.now()
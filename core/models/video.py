@@ -1,6 +1,16 @@
 from django.db import models
-from django.core.validators import MinValueValidator, MaxValueValidator
+from django.core.validators import (
+    MinValueValidator,
+    MaxValueValidator,
+    URLValidator,
+)
 from django.utils import timezone
+from core.managers.custom_managers import (
+    SubtitleQuerySet,
+    VideoAssetQuerySet,
+    VideoQuerySet,
+    VideoTagManager,
+)
 from .choices import (
     VideoStatus,
     VideoVisibility,
@@ -47,7 +57,7 @@ class Video(models.Model):
     )
 
     # Thumbnails
-    thumbnail_url = models.URLField(max_length=500, blank=True)
+    thumbnail_url = models.TextField(blank=True, validators=[URLValidator()])
     thumbnail_auto_generated = models.BooleanField(default=True)
 
     # Stats (denormalized)
@@ -77,14 +87,34 @@ class Video(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
     last_activity_at = models.DateTimeField(auto_now_add=True)  # For archival
 
+    objects = VideoQuerySet.as_manager()
+
     class Meta:
         db_table = "videos"
-        ordering = ["-published_at", "-created_at"]
+        # No default ordering: Meta.ordering forces an ORDER BY onto
+        # every query (counts and EXISTS included); callers order
+        # explicitly where it matters.
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(thumbnail_url__length__lte=500),
+                name="video_thumbnail_url_len",
+            ),
+        ]
         indexes = [
             models.Index(fields=["channel", "status"]),
             models.Index(fields=["status", "visibility", "published_at"]),
             models.Index(fields=["view_count"]),
             models.Index(fields=["-published_at"]),
+            # Serves the homepage feed as an index-only scan: partial over
+            # the live subset, covering the card columns.
+            models.Index(
+                fields=["-published_at"],
+                name="published_public_videos_idx",
+                condition=models.Q(
+                    status="PUBLISHED", visibility="PUBLIC", deleted_at__isnull=True
+                ),
+                include=["title", "view_count", "thumbnail_url"],
+            ),
         ]
 
     def __str__(self):
@@ -97,10 +127,16 @@ class Video(models.Model):
             self.save()
 
     def increment_view_count(self, increment_by: int = 1):
-        self.view_count = models.F("view_count") + increment_by
-        self.last_activity_at = timezone.now()
-        self.save()
-        self.refresh_from_db()
+        # Buffered: the periodic flush coalesces N views into a single
+        # atomic UPDATE per video instead of a save + refresh round-trip
+        # per view (see core.services.view_buffer).
+        from core.services import view_buffer
+
+        view_buffer.record_view(self.pk, count=increment_by)
+
+    def is_blocked_in(self, country_code):
+        """Whether this video is geo-blocked for a country"""
+        return country_code in (self.geo_restrictions or [])
 
     @property
     def is_published(self):
@@ -116,9 +152,7 @@ class VideoVersion(models.Model):
     is_active = models.BooleanField(default=True)
 
     # Source file info
-    source_object_key = models.CharField(
-        max_length=500, help_text="S3 object key for original upload"
-    )
+    source_object_key = models.TextField(help_text="S3 object key for original upload")
     source_file_size_bytes = models.BigIntegerField(default=0)
     source_duration_seconds = models.IntegerField(default=0)
     source_resolution = models.CharField(max_length=20, blank=True)
@@ -143,6 +177,12 @@ class VideoVersion(models.Model):
         db_table = "video_versions"
         ordering = ["-version_number"]
         unique_together = [["video", "version_number"]]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(source_object_key__length__lte=500),
+                name="videoversion_object_key_len",
+            ),
+        ]
         indexes = [
             models.Index(fields=["video", "is_active"]),
         ]
@@ -162,12 +202,10 @@ class VideoAsset(models.Model):
     bitrate_kbps = models.IntegerField()
 
     # HLS paths
-    playlist_url = models.URLField(
-        max_length=500, help_text="Master or variant playlist URL"
-    )
-    segment_path_prefix = models.CharField(
-        max_length=500, help_text="S3 prefix for segment files"
+    playlist_url = models.TextField(
+        help_text="Master or variant playlist URL", validators=[URLValidator()]
     )
+    segment_path_prefix = models.TextField(help_text="S3 prefix for segment files")
 
     # File info
     file_size_bytes = models.BigIntegerField(default=0)
@@ -175,10 +213,19 @@ class VideoAsset(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = VideoAssetQuerySet.as_manager()
+
     class Meta:
         db_table = "video_assets"
         ordering = ["-bitrate_kbps"]
         unique_together = [["video_version", "resolution"]]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(playlist_url__length__lte=500)
+                & models.Q(segment_path_prefix__length__lte=500),
+                name="videoasset_paths_len",
+            ),
+        ]
         indexes = [
             models.Index(fields=["video_version", "resolution"]),
         ]
@@ -193,10 +240,14 @@ class VideoTag(models.Model):
     name = models.CharField(max_length=50, unique=True, db_index=True)
     slug = models.SlugField(max_length=50, unique=True)
 
+    # Refreshed in batch by VideoTag.objects.refresh_usage_counts();
+    # per-insert bumps would make popular tags write hotspots.
     usage_count = models.IntegerField(default=0)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = VideoTagManager()
+
     class Meta:
         db_table = "video_tags"
         ordering = ["-usage_count", "name"]
@@ -236,8 +287,8 @@ class Subtitle(models.Model):
     language_code = models.CharField(max_length=5)
     language_name = models.CharField(max_length=50)
 
-    file_key = models.CharField(max_length=500, help_text="S3 key for WebVTT file")
-    file_url = models.URLField(max_length=500)
+    file_key = models.TextField(help_text="S3 key for WebVTT file")
+    file_url = models.TextField(validators=[URLValidator()])
 
     is_published = models.BooleanField(default=True)
     is_auto_generated = models.BooleanField(default=False)
@@ -245,9 +296,18 @@ class Subtitle(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SubtitleQuerySet.as_manager()
+
     class Meta:
         db_table = "subtitles"
         unique_together = [["video_version", "language_code"]]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(file_key__length__lte=500)
+                & models.Q(file_url__length__lte=500),
+                name="subtitle_paths_len",
+            ),
+        ]
         indexes = [
             models.Index(fields=["video_version", "language_code"]),
         ]
@@ -0,0 +1,69 @@
+import threading
+
+from django.core.cache import cache
+from django.db import models
+
+from core.services.view_buffer import _incr
+
+# Like/dislike/comment/share events all UPDATE the denormalized counters
+# on the videos row, so a viral video becomes a row-lock hotspot.
+# Deltas accumulate in the configured cache backend (atomic incr — Redis
+# in production) and flush() coalesces them into one UPDATE per video,
+# trading exact realtime for the flush interval's staleness. Views take
+# the same path through core.services.view_buffer.
+
+COUNTER_FIELDS = ("like_count", "dislike_count", "comment_count", "share_count")
+
+STAT_KEY = "vstats:{video_id}:{field}"
+
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def record(video_id, field, delta=1):
+    """Buffer a counter delta (negative for un-like and friends)"""
+    if field not in COUNTER_FIELDS:
+        raise ValueError(f"Unknown video counter {field!r}")
+    _incr(STAT_KEY.format(video_id=video_id, field=field), delta)
+    with _pending_lock:
+        _pending.add(video_id)
+
+
+def record_like(video_id, delta=1):
+    record(video_id, "like_count", delta)
+
+
+def record_dislike(video_id, delta=1):
+    record(video_id, "dislike_count", delta)
+
+
+def record_comment(video_id, delta=1):
+    record(video_id, "comment_count", delta)
+
+
+def record_share(video_id, delta=1):
+    record(video_id, "share_count", delta)
+
+
+def flush():
+    """Apply buffered counter deltas, one UPDATE per video; returns rows
+    touched. Drained with read + decr so mid-flush events survive."""
+    from core.models.video import Video
+
+    with _pending_lock:
+        pending = list(_pending)
+        _pending.clear()
+
+    flushed = 0
+    for video_id in pending:
+        deltas = {}
+        for field in COUNTER_FIELDS:
+            key = STAT_KEY.format(video_id=video_id, field=field)
+            value = cache.get(key, 0)
+            if value:
+                cache.decr(key, value)
+                deltas[field] = models.F(field) + value
+        if deltas:
+            Video.objects.filter(pk=video_id).update(**deltas)
+            flushed += 1
+    return flushed
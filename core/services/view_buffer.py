@@ -0,0 +1,93 @@
+import threading
+
+from django.core.cache import cache
+from django.db import models
+from django.utils import timezone
+
+# Raw VIEW events are the highest-volume write in the system and most
+# never need row-level detail. Instead of inserting one interactions row
+# per view, counters accumulate in the configured cache backend (atomic
+# incr — Redis in production) and flush() folds the deltas into the
+# VideoAnalytics daily rollup. Unique-viewer sketches (PFADD/PFCOUNT)
+# need Redis HyperLogLog commands the cache API does not expose, so
+# unique_viewers stays with the aggregation job.
+
+VIEWS_KEY = "va:{video_id}:{date}:views"
+WATCH_KEY = "va:{video_id}:{date}:wt"
+
+_pending = set()
+_pending_lock = threading.Lock()
+
+
+def _incr(key, delta):
+    if not delta:
+        return
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # Key not there yet; add() loses gracefully to a concurrent writer.
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+def record_view(video_id, watch_seconds=0, count=1):
+    """Count views (and optional watch time) without a database write"""
+    date = timezone.localdate()
+    _incr(VIEWS_KEY.format(video_id=video_id, date=date), count)
+    _incr(WATCH_KEY.format(video_id=video_id, date=date), watch_seconds)
+    with _pending_lock:
+        _pending.add((video_id, date))
+
+
+def flush():
+    """Fold buffered counters into VideoAnalytics and the Video row;
+    returns rows touched.
+
+    Counters are drained with a read + decr rather than delete so views
+    recorded between the two stay buffered for the next flush. The
+    denormalized Video.view_count / last_activity_at get the same delta
+    in one UPDATE per video — N buffered views collapse to one write.
+    """
+    from django.db import transaction
+    from django.db.models.functions import Now
+
+    from core.models.analytics import VideoAnalytics
+    from core.models.video import Video
+
+    with _pending_lock:
+        pending = list(_pending)
+        _pending.clear()
+
+    flushed = 0
+    for video_id, date in pending:
+        views_key = VIEWS_KEY.format(video_id=video_id, date=date)
+        watch_key = WATCH_KEY.format(video_id=video_id, date=date)
+        views = cache.get(views_key, 0)
+        watch_seconds = cache.get(watch_key, 0)
+        if views:
+            cache.decr(views_key, views)
+        if watch_seconds:
+            cache.decr(watch_key, watch_seconds)
+        if not views and not watch_seconds:
+            continue
+        deltas = dict(
+            views=models.F("views") + views,
+            watch_time_seconds=models.F("watch_time_seconds") + watch_seconds,
+        )
+        with transaction.atomic():
+            rollup = VideoAnalytics.objects.filter(video_id=video_id, date=date)
+            if not rollup.update(**deltas):
+                _, created = VideoAnalytics.objects.get_or_create(
+                    video_id=video_id,
+                    date=date,
+                    defaults=dict(views=views, watch_time_seconds=watch_seconds),
+                )
+                if not created:
+                    rollup.update(**deltas)
+            if views:
+                Video.objects.filter(pk=video_id).update(
+                    view_count=models.F("view_count") + views,
+                    last_activity_at=Now(),
+                )
+        flushed += 1
+    return flushed
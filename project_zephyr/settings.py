@@ -39,6 +39,8 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "cachalot",
+    "django_fast_count",
 ]
 
 MIDDLEWARE = [
@@ -49,6 +51,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.RequestQueryCacheMiddleware",
 ]
 
 ROOT_URLCONF = "project_zephyr.urls"
@@ -83,6 +86,24 @@ DATABASES = {
 }
 
 
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# ORM-level query caching (django-cachalot). Only the read-mostly tables
+# are cached; write-heavy analytics tables would churn the cache.
+CACHALOT_ONLY_CACHABLE_TABLES = (
+    "subscription_plans",
+    "popular_searches",
+    "trending_videos",
+)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -130,3 +151,5 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Custom User Model
 AUTH_USER_MODEL = "core.User"
+
+AUTHENTICATION_BACKENDS = ["authentication.backends.EmailBackend"]